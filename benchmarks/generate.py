@@ -0,0 +1,195 @@
+# benchmarks/generate.py
+"""
+Synthetic raw-data generator for throughput benchmarks.
+
+Writes the same three raw files the collectors produce
+(government_news.json, sri_lanka_news.json, srilanka_weather.json) at a
+configurable scale:
+
+- headlines mix English, Sinhala and Tamil, built from ADVANCED_RULES
+  keywords plus filler, with near-duplicate variants so trend clustering
+  has real work to do
+- districts come from utils.region.DISTRICTS
+- timestamps use each source's real format (RFC 822 pubDate, GDELT
+  seendate, YouTube ISO, gov fetched_at ISO), spread over the last 72h
+
+    python -m benchmarks.generate --scale 10k --out /tmp/bench/data/raw
+"""
+
+import argparse
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+from src.events.classify_advanced import ADVANCED_RULES
+from src.utils.region import DISTRICTS
+from src.utils.script import LATIN, SINHALA, TAMIL, dominant_script
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# share of headlines per script
+SCRIPT_MIX = [(LATIN, 0.75), (SINHALA, 0.15), (TAMIL, 0.10)]
+
+# share of media items per source (gov and weather are added on top)
+SOURCE_MIX = [("rss", 0.6), ("gdelt", 0.25), ("google_news", 0.1), ("youtube", 0.05)]
+
+GOV_SHARE = 0.03
+WEATHER_SHARE = 0.02
+
+FILLER = {
+    LATIN: [
+        "officials say", "residents report", "amid concerns", "update",
+        "authorities warn", "latest", "this week", "according to police",
+        "ministry says", "in several areas",
+    ],
+    SINHALA: ["නිලධාරීන් පවසයි", "අද", "ප්‍රදේශවාසීන්", "යාවත්කාලීන"],
+    TAMIL: ["அதிகாரிகள் தெரிவிப்பு", "இன்று", "மக்கள்", "புதிய தகவல்"],
+}
+
+GENERAL_TOPICS = [
+    "cricket team wins series", "new film released", "school sports meet",
+    "temple festival held", "book launch ceremony", "art exhibition opens",
+]
+
+
+def parse_scale(value: str) -> int:
+    value = value.lower()
+    return SCALES[value] if value in SCALES else int(value)
+
+
+def _weighted(rng: random.Random, mix):
+    r = rng.random()
+    acc = 0.0
+    for item, w in mix:
+        acc += w
+        if r < acc:
+            return item
+    return mix[-1][0]
+
+
+def _keywords_by_script():
+    vocab = {LATIN: [], SINHALA: [], TAMIL: []}
+    for keywords in ADVANCED_RULES.values():
+        for kw in keywords:
+            script = dominant_script(kw)
+            if script in vocab:
+                vocab[script].append(kw)
+    return vocab
+
+
+def _format_ts(source: str, dt: datetime):
+    if source in ("rss", "google_news"):
+        return format_datetime(dt, usegmt=(source == "google_news"))
+    if source == "gdelt":
+        return dt.strftime("%Y%m%dT%H%M%SZ")
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")          # youtube / gov
+
+
+class HeadlineFactory:
+    """Headlines with a pool of recurring stories (for trend clustering)."""
+
+    def __init__(self, rng: random.Random, story_pool: int):
+        self.rng = rng
+        self.vocab = _keywords_by_script()
+        self.stories = [self._fresh(_weighted(rng, SCRIPT_MIX)) for _ in range(story_pool)]
+
+    def _fresh(self, script: str):
+        rng = self.rng
+        district = rng.choice(DISTRICTS)
+        if script == LATIN and rng.random() < 0.15:
+            topic = rng.choice(GENERAL_TOPICS)
+        else:
+            topic = rng.choice(self.vocab[script])
+        return script, f"{topic.capitalize()} in {district}", district
+
+    def headline(self):
+        rng = self.rng
+        # ~40% of items retell an existing story with a small variation
+        if rng.random() < 0.4:
+            script, base, district = rng.choice(self.stories)
+        else:
+            script, base, district = self._fresh(_weighted(rng, SCRIPT_MIX))
+        title = f"{base} - {rng.choice(FILLER[script])}"
+        summary = f"{base}. {rng.choice(FILLER[script])} {rng.choice(FILLER[script])}."
+        return title, summary, district
+
+
+def generate_corpus(n: int, out_dir: Path, seed: int = 7, now: datetime = None):
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    factory = HeadlineFactory(rng, story_pool=max(10, n // 50))
+
+    def when():
+        return now - timedelta(seconds=rng.randint(0, 72 * 3600))
+
+    n_gov = int(n * GOV_SHARE)
+    n_weather = int(n * WEATHER_SHARE)
+    n_media = n - n_gov - n_weather
+
+    media = []
+    for i in range(n_media):
+        source = _weighted(rng, SOURCE_MIX)
+        title, summary, _ = factory.headline()
+        media.append({
+            "source": source,
+            "title": title,
+            "link": f"https://example.lk/{source}/{i}",
+            "published": _format_ts(source, when()),
+            "summary": summary,
+            "content": summary,
+        })
+
+    gov = []
+    for i in range(n_gov):
+        title, summary, _ = factory.headline()
+        dt = when()
+        gov.append({
+            "title": title,
+            "url": f"https://gov.example.lk/press/{i}",
+            "summary": summary if rng.random() < 0.5 else "",
+            "published": format_datetime(dt) if rng.random() < 0.5 else None,
+            "source": "Disaster Management Centre",
+            "fetched_at": dt.isoformat(),
+        })
+
+    weather = []
+    per_district = max(1, n_weather // len(DISTRICTS))
+    for district in DISTRICTS:
+        for k in range(per_district):
+            dt = now - timedelta(hours=per_district - k)
+            weather.append({
+                "district": district,
+                "temperature": round(rng.uniform(22, 34), 2),
+                "humidity": rng.randint(55, 98),
+                "pressure": rng.randint(1002, 1015),
+                "wind_speed": round(rng.uniform(0, 60), 2),
+                "rain_1h": round(max(0.0, rng.gauss(2, 6)), 2),
+                "rain_3h": round(max(0.0, rng.gauss(6, 12)), 2),
+                "weather_main": rng.choice(["Clouds", "Rain", "Thunderstorm", "Clear"]),
+                "warnings": [],
+                "timestamp": dt.isoformat(),
+            })
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, items in (
+        ("government_news.json", gov),
+        ("sri_lanka_news.json", media),
+        ("srilanka_weather.json", weather),
+    ):
+        with open(out_dir / name, "w", encoding="utf-8") as f:
+            json.dump(items, f, ensure_ascii=False)
+
+    return {"media": len(media), "gov": len(gov), "weather": len(weather)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw-data corpus")
+    parser.add_argument("--scale", default="1k", help="1k, 10k, 100k, 1m or an integer")
+    parser.add_argument("--out", default="data/raw")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    counts = generate_corpus(parse_scale(args.scale), Path(args.out), args.seed)
+    print(f"Generated {counts} → {args.out}")
@@ -0,0 +1,168 @@
+# benchmarks/run.py
+"""
+Stage-by-stage throughput benchmark.
+
+Generates a synthetic corpus in a scratch directory, then runs and times
+each pipeline stage in-process, in pipeline order (normalize →
+trim_last_day → classify_advanced → severity → live partials → fused
+scoring engine → bootstrap bands → history snapshot) plus the
+end-to-end total. The standalone score / score_district / aggregate
+stages the engine replaced are timed too, for comparison, but left out
+of end_to_end.
+Results are written as JSON under benchmarks/results/ so runs on
+different commits can be compared:
+
+    python -m benchmarks.run --scale 10k
+    python -m benchmarks.run --scale 10k --compare benchmarks/results/<older>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.generate import generate_corpus, parse_scale
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+# standalone stages the fused engine replaces; timed, but not in end_to_end
+LEGACY_STAGES = {"score", "score_district", "aggregate"}
+
+
+def _stages(workers: int):
+    # imported lazily so import cost is not charged to the first stage
+    from src.events import normalize, trim_last_day, classify_advanced, severity
+    from src.industry import score, score_district, live, engine, uncertainty, history
+    from src.district import aggregate
+
+    return [
+        ("normalize", lambda: normalize.main(workers)),
+        ("trim_last_day", trim_last_day.trim_last_day),
+        ("classify_advanced", lambda: classify_advanced.classify_events_advanced(workers)),
+        ("severity", severity.apply_severity),
+        ("live_partials", live.build_partials),
+        ("score", score.score_industries),
+        ("score_district", score_district.score_districts),
+        ("aggregate", aggregate.main),
+        ("engine", engine.run_engine),
+        ("uncertainty", lambda: uncertainty.run_uncertainty(workers=workers)),
+        ("history", history.append_run),
+    ]
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _count_events(workdir: Path) -> int:
+    with open(workdir / "data/processed/events.json", "r", encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+def run_benchmark(n: int, workers: int = 1, seed: int = 7, warm: bool = False) -> dict:
+    stages = {}
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        workdir = Path(tmp)
+        raw_counts = generate_corpus(n, workdir / "data/raw", seed)
+        (workdir / "data/processed").mkdir(parents=True)
+
+        os.chdir(workdir)
+        try:
+            passes = ["cold", "warm"] if warm else ["cold"]
+            for label in passes:
+                timings = {}
+                for name, fn in _stages(workers):
+                    t0 = time.perf_counter()
+                    fn()
+                    timings[name] = round(time.perf_counter() - t0, 4)
+                timings["end_to_end"] = round(
+                    sum(t for name, t in timings.items() if name not in LEGACY_STAGES), 4
+                )
+                stages[label] = timings
+            events = _count_events(workdir)
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "commit": _git_commit(),
+        "run_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "scale": n,
+        "events": events,
+        "raw": raw_counts,
+        "workers": workers,
+        "seed": seed,
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "stages": stages,
+        "throughput_eps": {
+            label: round(events / t["end_to_end"], 1) if t["end_to_end"] else None
+            for label, t in stages.items()
+        },
+    }
+
+
+def save_result(result: dict) -> Path:
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = result["run_at"].replace(":", "").replace("-", "")
+    path = RESULTS_DIR / f"{stamp}-{result['commit']}-{result['scale']}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return path
+
+
+def compare(result: dict, baseline_path: Path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+
+    print(f"\nvs {base['commit']} (scale {base['scale']}):")
+    for label, timings in result["stages"].items():
+        old = base["stages"].get(label, {})
+        for name, secs in timings.items():
+            if name not in old:
+                print(f"  {label:5} {name:18} {secs:9.3f}s   (new)")
+                continue
+            ratio = secs / old[name] if old[name] else float("inf")
+            print(f"  {label:5} {name:18} {secs:9.3f}s   was {old[name]:9.3f}s   x{ratio:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline throughput benchmark")
+    parser.add_argument("--scale", default="1k", help="1k, 10k, 100k, 1m or an integer")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--warm", action="store_true",
+                        help="run every stage a second time with caches populated")
+    parser.add_argument("--compare", type=Path, help="earlier result JSON to diff against")
+    args = parser.parse_args()
+
+    result = run_benchmark(parse_scale(args.scale), args.workers, args.seed, args.warm)
+    path = save_result(result)
+
+    for label, timings in result["stages"].items():
+        print(f"[{label}]")
+        for name, secs in timings.items():
+            print(f"  {name:18} {secs:9.3f}s")
+    print(f"\n{result['events']} events · results → {path}")
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,20 @@ import numpy as np
 from pathlib import Path
 from textwrap import dedent
 import re
+import sys
 
 import streamlit as st
 import time
 
+# make `src` importable when launched with `streamlit run dashboard/app.py`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.events.severity import recency_weights, severity_at
+from src.events.table import EventTable
+from src.industry.history import ScoreHistory
+from src.industry.live import ScorePartials
+from src.industry.uncertainty import BootstrapModel, bootstrap_scores, score_bands
+from src.utils.timeparse import now_epoch
+
 # Auto-refresh every 30 minutes (1800 seconds)
 if "last_refresh" not in st.session_state:
     st.session_state.last_refresh = time.time()
@@ -54,6 +64,12 @@ st.set_page_config(page_title="Sri Lanka Dashboard", layout="wide")
 
 EVENTS_FILE = "data/processed/events.json"
 DISTRICT_FILE = "data/processed/district_scores.json"
+INDUSTRY_FILE = "data/processed/industry_scores.json"
+PROVINCE_FILE = "data/processed/province_scores.json"
+INTERVALS_FILE = "data/processed/score_intervals.json"
+
+# one clock reading per page run: live severities, scores and bands all use it
+VIEW_NOW = now_epoch()
 
 # ----------------------------------------------------
 # Load Data
@@ -61,10 +77,50 @@ DISTRICT_FILE = "data/processed/district_scores.json"
 def load_events() -> pd.DataFrame:
     with open(EVENTS_FILE, "r", encoding="utf-8") as f:
         events = json.load(f)
-    return pd.DataFrame(events)
+    df = pd.DataFrame(events)
+
+    # Epoch seconds are parsed once at ingest; only old files need string parsing
+    if "ts" in df:
+        df["event_time"] = pd.to_datetime(df["ts"], unit="s", utc=True)
+    else:
+        df["event_time"] = pd.to_datetime(df["timestamp"], errors="coerce", utc=True)
+
+    # Severity as of now: static part + recency at view time
+    if "severity_static" in df and "ts" in df and df["severity_static"].notna().all():
+        ts = df["ts"].fillna(0).to_numpy(dtype=np.int64)
+        df["severity"] = severity_at(df["severity_static"].to_numpy(), recency_weights(ts, VIEW_NOW))
+    return df
+
+
+def overlay_live(raw: dict, live: dict) -> dict:
+    """Replace the scores in a scores file with their view-time values.
+
+    Drivers, district lists and event counts stay as the pipeline wrote them.
+    """
+    for name, block in live.items():
+        if name not in raw:
+            continue
+        for key, value in block.items():
+            if isinstance(value, dict):
+                raw[name].setdefault(key, {}).update(value)
+            elif key not in ("event_count", "districts"):
+                raw[name][key] = value
+    return raw
+
+
+def load_scores(path: str, key: str, live: dict | None) -> pd.DataFrame | None:
+    """Industry / province scores file as one row per entry, live values overlaid."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if live is not None:
+        overlay_live(raw, live)
+    return pd.DataFrame([{key: name, **info} for name, info in raw.items()])
 
 
-def load_district_scores() -> pd.DataFrame | None:
+def load_district_scores(partials: ScorePartials | None) -> pd.DataFrame | None:
     path = Path(DISTRICT_FILE)
     if not path.exists():
         return None
@@ -72,6 +128,10 @@ def load_district_scores() -> pd.DataFrame | None:
     with open(path, "r", encoding="utf-8") as f:
         raw = json.load(f)
 
+    # Re-evaluate recency decay at view time when the partial-sum cache exists
+    if partials is not None and isinstance(raw, dict):
+        overlay_live(raw, partials.district_scores(VIEW_NOW))
+
     # handle dict {"Colombo": {...}, ...}
     if isinstance(raw, dict):
         rows = []
@@ -85,8 +145,51 @@ def load_district_scores() -> pd.DataFrame | None:
     return pd.DataFrame(raw)
 
 
+def load_score_intervals(live: bool) -> dict:
+    """Bootstrap bands per district × industry (src.industry.uncertainty).
+
+    The pipeline's bands describe the scores at its own run time. When the
+    bars show view-time scores, the bands are re-bootstrapped at VIEW_NOW
+    with the pipeline's settings so both refer to the same instant.
+    """
+    path = Path(INTERVALS_FILE)
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        bands = json.load(f)
+
+    if live:
+        meta = bands.get("bootstrap", {})
+        model = BootstrapModel(EventTable.load(Path(EVENTS_FILE)), VIEW_NOW)
+        samples = bootstrap_scores(model, meta.get("n", 200), meta.get("seed", 0))
+        bands = score_bands(samples, meta.get("level", 0.9))
+    return bands.get("districts", {})
+
+
+def band_errors(categories, values, bands: dict, kind: str):
+    """(above, below) error-bar lengths around each bar; 0 where no band exists."""
+    above, below = [], []
+    for category, value in zip(categories, values):
+        band = bands.get(category)
+        if band is None:
+            above.append(0.0)
+            below.append(0.0)
+            continue
+        above.append(max(band[f"{kind}_high"] - value, 0.0))
+        below.append(max(value - band[f"{kind}_low"], 0.0))
+    return above, below
+
+
 df = load_events()
-district_df = load_district_scores()
+partials = ScorePartials.load()
+district_df = load_district_scores(partials)
+industry_df = load_scores(
+    INDUSTRY_FILE, "industry", partials.industry_scores(VIEW_NOW) if partials is not None else None
+)
+province_df = load_scores(
+    PROVINCE_FILE, "province", partials.province_scores(VIEW_NOW) if partials is not None else None
+)
+intervals = load_score_intervals(partials is not None)
 
 # ----------------------------------------------------
 # CREATE TABS
@@ -108,7 +211,7 @@ tab1, tab2, tab3 = st.tabs(
 with tab1:
     st.title("🇱🇰 Sri Lanka — National Situation Overview")
 
-    last_time = df["timestamp"].max()
+    last_time = df["event_time"].max()
     st.caption(f"Last Updated: **{last_time}**")
 
     # Little intro block matching your criteria bullet list
@@ -144,10 +247,9 @@ with tab1:
     # ------------------------------------------------
     st.markdown("## 📡 National Activity Indicators")
 
-    # Convert timestamps once for trends
-    df_ts = df.copy()
-    df_ts["ts"] = pd.to_datetime(df_ts["timestamp"], errors="coerce", utc=True)
-    df_ts = df_ts.dropna(subset=["ts"])
+    # Timestamps were converted once in load_events
+    df_ts = df.drop(columns=["ts"], errors="ignore")
+    df_ts = df_ts.rename(columns={"event_time": "ts"}).dropna(subset=["ts"])
 
     if not df_ts.empty:
         # Hourly aggregation for activity trend
@@ -413,6 +515,21 @@ with tab1:
 """
         st.markdown(insights_md)
 
+    if industry_df is not None and not industry_df.empty:
+        st.markdown("### 🏭 National Industry Scores")
+        st.dataframe(
+            industry_df[["industry", "risk_score", "risk_level", "opp_score", "opp_level"]],
+            use_container_width=True,
+        )
+
+    if province_df is not None and not province_df.empty:
+        st.markdown("### 🗺️ Province Scores")
+        st.dataframe(
+            province_df[["province", "risk_score", "risk_level", "opp_score", "opp_level",
+                         "event_count"]],
+            use_container_width=True,
+        )
+
     # ------------------------------------------------
     # DONUT CHART – EVENT CATEGORY
     # ------------------------------------------------
@@ -460,14 +577,7 @@ with tab1:
     # Filter only news-like sources
     news_df = df[df["source_type"].str.contains("news", case=False, na=False)].copy()
 
-    # Prefer 'published' if present, else fallback to 'timestamp'
-    def get_publish_time(row):
-        return row.get("published") or row.get("timestamp")
-
-    news_df["published_final"] = news_df.apply(get_publish_time, axis=1)
-    news_df["published_parsed"] = pd.to_datetime(
-        news_df["published_final"], errors="coerce", utc=True
-    )
+    news_df["published_parsed"] = news_df["event_time"]
 
     # Keep only last 48 hours
     cutoff = pd.Timestamp.utcnow() - pd.Timedelta(hours=48)
@@ -482,7 +592,7 @@ with tab1:
         for _, row in critical.iterrows():
             # Human readable time
             try:
-                ts = pd.to_datetime(row["published_final"], utc=True)
+                ts = row["published_parsed"]
                 diff = pd.Timestamp.utcnow() - ts
                 hours = int(diff.total_seconds() // 3600)
 
@@ -590,11 +700,19 @@ with tab2:
 
     risk_df = pd.DataFrame({"Category": industries, "Risk Score": risk_values})
 
+    # Bootstrap confidence band per industry (few events → wide band)
+    district_bands = intervals.get(selected, {})
+    risk_df["band_high"], risk_df["band_low"] = band_errors(
+        industries, risk_values, district_bands, "risk"
+    )
+
     fig_risk = px.bar(
         risk_df,
         x="Category",
         y="Risk Score",
         text="Risk Score",
+        error_y="band_high" if district_bands else None,
+        error_y_minus="band_low" if district_bands else None,
         range_y=[0, 1],
         title="Risk Score Breakdown",
         color="Risk Score",
@@ -626,12 +744,17 @@ with tab2:
     opp_values.insert(0, row.get("opp_score", 0))
 
     opp_df = pd.DataFrame({"Category": industries2, "Opportunity Score": opp_values})
+    opp_df["band_high"], opp_df["band_low"] = band_errors(
+        industries2, opp_values, district_bands, "opp"
+    )
 
     fig_opp = px.bar(
         opp_df,
         x="Category",
         y="Opportunity Score",
         text="Opportunity Score",
+        error_y="band_high" if district_bands else None,
+        error_y_minus="band_low" if district_bands else None,
         range_y=[0, 1],
         title="Opportunity Score Breakdown",
         color="Opportunity Score",
@@ -641,6 +764,79 @@ with tab2:
     fig_opp.update_layout(xaxis_title="", yaxis_title="Opportunity Score")
     st.plotly_chart(fig_opp, use_container_width=True)
 
+    if district_bands:
+        st.caption("Error bars: bootstrap confidence band from resampling this run's events.")
+
+    st.markdown("---")
+
+    # ----------------------------------------------------
+    # 🔎 DRIVER DRILL-DOWN
+    # ----------------------------------------------------
+    st.subheader("🔎 Top Drivers")
+
+    driver_industries = [
+        key for key, value in row.items()
+        if isinstance(value, dict) and value.get("top_driver_events")
+    ]
+
+    if driver_industries:
+        picked = st.selectbox("Industry", driver_industries, key="driver_industry")
+        refs = row[picked]["top_driver_events"]
+
+        # Drivers carry event ids, so this is a lookup, not a title search;
+        # an id stored twice (older events.json files) keeps its last copy
+        events_by_id = df.drop_duplicates("id", keep="last").set_index("id")
+        driver_rows = [
+            {
+                "title": events_by_id.at[r["id"], "title"],
+                "impact": r["impact"],
+                "event_type": events_by_id.at[r["id"], "event_type"],
+                "time": events_by_id.at[r["id"], "event_time"],
+                "url": events_by_id.at[r["id"], "url"],
+            }
+            for r in refs
+            if r["id"] in events_by_id.index
+        ]
+        st.dataframe(pd.DataFrame(driver_rows), use_container_width=True)
+    else:
+        st.info("No driver events recorded for this district.")
+
+    st.markdown("---")
+
+    # ----------------------------------------------------
+    # 🕒 SCORE HISTORY
+    # ----------------------------------------------------
+    st.subheader("🕒 Score History")
+
+    history = ScoreHistory()
+    history_industries = [
+        key for key, value in row.items()
+        if isinstance(value, dict) and "risk_score" in value
+    ]
+    if history.last_run() is not None and history_industries:
+        h1, h2 = st.columns(2)
+        picked_history = h1.selectbox("Industry", history_industries, key="history_industry")
+        days = h2.slider("Days", 1, 90, 30, key="history_days")
+
+        since = int(time.time()) - days * 86400
+        ts, risk_hist, opp_hist = history.series(selected, picked_history, since)
+        if len(ts):
+            hist_df = pd.DataFrame({
+                "time": pd.to_datetime(ts, unit="s", utc=True),
+                "Risk": risk_hist,
+                "Opportunity": opp_hist,
+            })
+            fig_hist = px.line(
+                hist_df, x="time", y=["Risk", "Opportunity"], range_y=[0, 1],
+                title=f"{selected} — {picked_history} over {days} days",
+            )
+            fig_hist.update_layout(xaxis_title="", yaxis_title="Score")
+            st.plotly_chart(fig_hist, use_container_width=True)
+        else:
+            st.info("No runs recorded in this window.")
+    else:
+        st.info("No score history yet — it grows with each pipeline run.")
+
     st.markdown("---")
 
     # ----------------------------------------------------
@@ -1,15 +1,22 @@
 # src/events/classify_advanced.py
 
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from nltk.stem import PorterStemmer
-from fuzzywuzzy import fuzz
+from typing import Optional
 from src.utils.region import DISTRICTS, NATIONAL
+from .matcher import KeywordAutomaton, QGramFilter
+from .stem_index import StemPhraseIndex
+from .classify_cache import ClassificationCache, rules_version, text_key
+from .rules_artifact import load_artifact, save_artifact
+from .schema import event_epoch
+from src.utils.timeparse import now_epoch
+from src.utils.script import LATIN, SCRIPTS, detect_scripts, dominant_script, normalize_text
 
 EVENTS_PATH = Path("data/processed/events.json")
 
-ps = PorterStemmer()
-
 # --------------------------------------------------------------------
 # 1. BIG keyword library (English + Sinhala + Tamil, optimized size)
 # --------------------------------------------------------------------
@@ -17,8 +24,7 @@ ADVANCED_RULES = {
     # --- WEATHER & DISASTERS ------------------------------------------------
     "Flood": [
         # English
-        "flood", "flooding", "flash flood", "flood water", "flooded",
-        "inundation", "inundated", "water level rising", "river overflow",
+        "flood", "inundation", "water level rising", "river overflow",
         "river burst", "bank overflow", "reservoir spill", "dam overflow",
         "low lying areas under water", "roads under water",
         # Sinhala
@@ -72,7 +78,7 @@ ADVANCED_RULES = {
 
     "Cyclone": [
         "cyclone", "tropical storm", "low pressure area",
-        "storm surge", "cyclonic system", "deep depression",
+        "storm surge", "deep depression",
         # Sinhala
         "කුණාටුව", "අවපීඩන බලකේන්ද්‍රය",
         # Tamil
@@ -80,8 +86,7 @@ ADVANCED_RULES = {
     ],
 
     "Lightning": [
-        "lightning", "lightning strikes", "thunderstorm",
-        "electrical storm", "lightning advisory",
+        "lightning", "thunderstorm", "electrical storm",
         # Sinhala
         "මෙරුණු", "අකුණ", "අකුණු පහර",
         # Tamil
@@ -90,7 +95,7 @@ ADVANCED_RULES = {
 
     # --- TRANSPORT & LOGISTICS ---------------------------------------------
     "Train Issue": [
-        "train delay", "train cancelled", "train cancellation",
+        "train delay", "train cancelled",
         "railway strike", "rail strike", "train strike",
         "train derailment", "train accident", "locomotive failure",
         "slr strike", "railway line blocked"
@@ -201,7 +206,7 @@ ADVANCED_RULES = {
 
     "Political Event": [
         "president", "prime minister", "parliament", "cabinet meeting",
-        "political rally", "election", "polling", "dissolution of parliament",
+        "political rally", "election", "polling",
         "no confidence motion", "political crisis",
         # Sinhala
         "නායක", "විපක්ෂය", "මැතිවරණය",
@@ -223,7 +228,7 @@ ADVANCED_RULES = {
 
     # --- TOURISM ------------------------------------------------------------
     "Tourism": [
-        "tourist arrivals", "tourist arrival", "hotel bookings",
+        "tourist arrivals", "hotel bookings",
         "holiday season", "tourism boom", "travel advisory",
         "visa free", "visa on arrival", "charter flights",
         "tourism promotion", "occupancy rate",
@@ -273,6 +278,8 @@ def nlp_match(text: str, keywords) -> bool:
     - lowercased contains
     - fuzzy phrase match
     """
+    from fuzzywuzzy import fuzz
+
     text = text.lower()
 
     for kw in keywords:
@@ -290,25 +297,181 @@ def nlp_match(text: str, keywords) -> bool:
 
 
 # --------------------------------------------------------------------
-# 3. Headline clustering for trends
+# 2b. Compiled rules, routed by script
+#
+# Every keyword is NFC-normalized, stripped of zero-width joiners and
+# lowercased once, then filed under its dominant script. A text is only
+# matched against the matchers / fuzzy filters of the scripts it contains:
+# a pure-English headline never touches the Sinhala or Tamil keywords.
+# English keywords match by stemmed token sequence (so one "flood" entry
+# covers floods / flooded / flooding); Sinhala and Tamil keep substring
+# matching through the Aho-Corasick automaton.
 # --------------------------------------------------------------------
-def cluster_headlines(headlines):
-    clusters = []
-    used = set()
-
-    for i, h1 in enumerate(headlines):
-        if i in used:
-            continue
-        cluster = [h1]
-        used.add(i)
-        for j, h2 in enumerate(headlines):
-            if j in used:
-                continue
-            if fuzz.token_set_ratio(h1, h2) >= 75:
-                cluster.append(h2)
-                used.add(j)
-        clusters.append(cluster)
-    return clusters
+CATEGORIES = list(ADVANCED_RULES)
+
+# bump when the matching logic changes in a way that alters results
+MATCHER_VERSION = "3"
+RULES_VERSION = rules_version(ADVANCED_RULES, MATCHER_VERSION)
+
+
+def _by_script(entries):
+    """script → [global ids], keeping rule order inside each script."""
+    routed = {s: [] for s in SCRIPTS}
+    for gid, (_, kw) in enumerate(entries):
+        routed[dominant_script(kw)].append(gid)
+    return routed
+
+
+def _exact_matcher(script, keywords):
+    if script == LATIN:
+        return StemPhraseIndex(keywords)
+    return KeywordAutomaton(keywords)
+
+
+def compile_rules() -> dict:
+    """Build every matcher from ADVANCED_RULES (plain dict → picklable)."""
+    # global pattern id → (category index, normalized keyword), in rule order
+    keywords = [
+        (ci, normalize_text(kw))
+        for ci, category in enumerate(CATEGORIES)
+        for kw in ADVANCED_RULES[category]
+    ]
+    # multi-word keywords (the only ones nlp_match fuzzy-scores), in rule order
+    fuzzy_keywords = [(ci, kw) for ci, kw in keywords if len(kw.split()) > 1]
+
+    return {
+        "keywords": keywords,
+        "fuzzy_keywords": fuzzy_keywords,
+        # script → (matcher over that script's keywords, local id → global id)
+        "exact": {
+            script: (_exact_matcher(script, [keywords[g][1] for g in gids]), gids)
+            for script, gids in _by_script(keywords).items()
+        },
+        "fuzzy": {
+            script: (QGramFilter(fuzzy_keywords[g][1] for g in gids), gids)
+            for script, gids in _by_script(fuzzy_keywords).items()
+        },
+    }
+
+
+_COMPILED = None
+
+
+def compiled_rules() -> dict:
+    """
+    Compiled matchers, loaded from the prebuilt artifact for the current
+    RULES_VERSION when there is one (compiled and saved otherwise).
+    """
+    global _COMPILED
+    if _COMPILED is None:
+        _COMPILED = load_artifact(RULES_VERSION)
+        if _COMPILED is None:
+            _COMPILED = compile_rules()
+            save_artifact(_COMPILED, RULES_VERSION)
+    return _COMPILED
+
+
+def classify_text(text: str, scripts=None):
+    """
+    Same result as trying nlp_match() on each category in order, but every
+    exact keyword hit comes from one matcher pass per script present.
+    `scripts` is the ingest-time tag; detected here if missing.
+    Returns (category, matched keywords).
+    """
+    return _classify_normalized(normalize_text(text), scripts)
+
+
+def _classify_normalized(text: str, scripts=None):
+    rules = compiled_rules()
+    if scripts is None:
+        scripts = detect_scripts(text)
+
+    hits = []
+    for script in scripts:
+        matcher, gids = rules["exact"][script]
+        hits.extend(gids[local] for local in matcher.find_all(text))
+
+    exact = {}
+    for gid in sorted(hits):
+        ci, kw = rules["keywords"][gid]
+        exact.setdefault(ci, []).append(kw)
+
+    first_exact = min(exact) if exact else len(CATEGORIES)
+
+    # earlier categories can still win through a fuzzy phrase match;
+    # only keywords passing the bigram prefilter get fuzzy-scored
+    if first_exact > 0:
+        candidates = []
+        for script in scripts:
+            qfilter, gids = rules["fuzzy"][script]
+            candidates.extend(gids[local] for local in qfilter.candidates(text))
+
+        from fuzzywuzzy import fuzz
+
+        for fid in sorted(candidates):
+            ci, kw = rules["fuzzy_keywords"][fid]
+            if ci >= first_exact:
+                break
+            if fuzz.partial_ratio(kw, text) >= 80:
+                return CATEGORIES[ci], [kw]
+
+    if exact:
+        return CATEGORIES[first_exact], exact[first_exact]
+    return "General", []
+
+
+CLASSIFY_CHUNK = 256
+
+
+def _classify_chunk(items):
+    """Worker entry point: [(text, scripts)]. The compiled rules are loaded
+    in the parent before the pool forks, so workers share them copy-on-write."""
+    return [_classify_normalized(text, scripts) for text, scripts in items]
+
+
+def classify_batch(texts, cache: Optional[ClassificationCache] = None, workers: int = 1,
+                   scripts=None):
+    """
+    Classify many texts. Cache hits and duplicates are resolved in the
+    parent; the remaining unique texts are sharded across a process pool
+    in fixed chunks and merged back in input order.
+    `scripts` optionally holds the ingest-time script tags per text.
+    """
+    normalized = [normalize_text(t) for t in texts]
+    keys = [text_key(t) for t in normalized]
+    results = [None] * len(texts)
+
+    pending = {}                       # key → (text, scripts) of first occurrence
+    for i, key in enumerate(keys):
+        hit = cache.get(key) if cache is not None else None
+        if hit is not None:
+            results[i] = hit
+        elif key not in pending:
+            pending[key] = (normalized[i], (scripts[i] or None) if scripts else None)
+
+    todo = list(pending.items())
+    chunks = [
+        [item for _, item in todo[start:start + CLASSIFY_CHUNK]]
+        for start in range(0, len(todo), CLASSIFY_CHUNK)
+    ]
+
+    if workers > 1 and len(chunks) > 1:
+        compiled_rules()   # load before forking so workers inherit it
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            classified = [r for chunk in pool.map(_classify_chunk, chunks) for r in chunk]
+    else:
+        classified = [r for chunk in chunks for r in _classify_chunk(chunk)]
+
+    fresh = {}
+    for (key, _), (event_type, keywords) in zip(todo, classified):
+        fresh[key] = (event_type, keywords)
+        if cache is not None:
+            cache.put(key, event_type, keywords)
+
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = fresh[key]
+    return results
 
 
 def source_confidence(source_type: str) -> float:
@@ -329,9 +492,10 @@ def source_confidence(source_type: str) -> float:
 
 
 # --------------------------------------------------------------------
-# 4. Main advanced classifier
+# 3. Main advanced classifier
 # --------------------------------------------------------------------
-def classify_events_advanced():
+def classify_events_advanced(workers: int = 1, hours: Optional[float] = None):
+    """`hours` is the trend window; defaults to the events window of trim_last_day."""
     if not EVENTS_PATH.exists():
         print("events.json not found!")
         return
@@ -339,27 +503,42 @@ def classify_events_advanced():
     with open(EVENTS_PATH, "r", encoding="utf-8") as f:
         events = json.load(f)
 
-    # Build clusters of similar headlines
-    titles = [ev.get("title", "") for ev in events]
-    clusters = cluster_headlines(titles)
-    cluster_sizes = {t: len(c) for c in clusters for t in c}
+    from .trend_index import HeadlineClusterIndex, WINDOW_HOURS as TREND_WINDOW_HOURS
+
+    # Assign headlines to the persistent trend clusters (no global recluster)
+    clusters = HeadlineClusterIndex.load()
+    hours = TREND_WINDOW_HOURS if hours is None else hours
+    now = now_epoch()
+    cutoff = now - int(hours * 3600)
+    clusters.expire(cutoff)
 
+    cluster_ids = []
     for ev in events:
-        title = ev.get("title", "") or ""
-        summary = ev.get("summary", "") or ""
-        text = f"{title} {summary}".strip()
-
-        # pick best matching category
-        chosen_type = "General"
-        for category, keywords in ADVANCED_RULES.items():
-            if nlp_match(text, keywords):
-                chosen_type = category
-                break
+        # undated events count from the run that sees them, so they expire
+        # a window after they stop appearing
+        ts = event_epoch(ev)
+        ts = now if ts is None else ts
+        if ts < cutoff:
+            cluster_ids.append(None)
+        else:
+            cluster_ids.append(clusters.assign(ev.get("id") or ev.get("title", ""), ev.get("title", "") or "", ts))
+
+    cache = ClassificationCache.load(RULES_VERSION)
+
+    texts = [
+        f"{ev.get('title', '') or ''} {ev.get('summary', '') or ''}".strip()
+        for ev in events
+    ]
+    # pick best matching category (first in rule order)
+    scripts = [ev.get("scripts") for ev in events]
+    classified = classify_batch(texts, cache, workers, scripts)
 
+    for ev, cid, (chosen_type, keywords) in zip(events, cluster_ids, classified):
         ev["event_type"] = chosen_type
+        ev["matched_keywords"] = keywords
 
         # trend strength = how many similar headlines we saw
-        tsize = cluster_sizes.get(title, 1)
+        tsize = clusters.size(cid)
         ev["trend_strength"] = tsize
 
         # confidence = base 0.5 + trend + source reliability
@@ -370,8 +549,27 @@ def classify_events_advanced():
     with open(EVENTS_PATH, "w", encoding="utf-8") as f:
         json.dump(events, f, indent=2, ensure_ascii=False)
 
-    print(f"Advanced classification complete for {len(events)} events.")
+    cache.save()
+    clusters.save()
+
+    print(
+        f"Advanced classification complete for {len(events)} events "
+        f"(cache: {cache.hits} hits, {cache.misses} misses, workers={workers})."
+    )
 
 
 if __name__ == "__main__":
-    classify_events_advanced()
+    parser = argparse.ArgumentParser(description="Keyword + fuzzy event classification")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="process pool size (1 = run in-process)")
+    parser.add_argument("--hours", type=float, default=None,
+                        help="trend window (default: trim_last_day's events window)")
+    parser.add_argument("--build-rules", action="store_true",
+                        help="only (re)build the compiled rules artifact")
+    args = parser.parse_args()
+
+    if args.build_rules:
+        path = save_artifact(compile_rules(), RULES_VERSION)
+        print(f"Compiled rules artifact → {path}")
+    else:
+        classify_events_advanced(args.workers, args.hours)
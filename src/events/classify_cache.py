@@ -0,0 +1,85 @@
+# src/events/classify_cache.py
+"""
+Persistent classification cache.
+
+    key   = sha1(lowercased "title summary")   (the exact classifier input)
+    value = (event_type, matched keywords)
+
+The file records the rules version it was built with. If ADVANCED_RULES
+(or the matching logic version) changes, the whole cache is discarded on
+load. Entries are kept in LRU order and trimmed to MAX_ENTRIES on save.
+"""
+
+import json
+from collections import OrderedDict
+from hashlib import sha1
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .store import write_json_atomic
+
+CACHE_PATH = Path("data/cache/classify_cache.json")
+MAX_ENTRIES = 50000
+
+
+def rules_version(rules: dict, logic_version: str) -> str:
+    """Hash of the keyword rules + matcher logic version."""
+    blob = json.dumps([logic_version, rules], sort_keys=True, ensure_ascii=False)
+    return sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def text_key(text: str) -> str:
+    return sha1(text.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+
+    def __init__(self, version: str, path: Path = CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        self.version = version
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Tuple[str, List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, version: str, path: Path = CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        cache = cls(version, path, max_entries)
+        if not path.exists():
+            return cache
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+
+        # rules changed → every cached answer is suspect
+        if data.get("rules_version") != version:
+            return cache
+
+        for key, event_type, keywords in data.get("entries", []):
+            cache.entries[key] = (event_type, keywords)
+        return cache
+
+    def get(self, key: str) -> Optional[Tuple[str, List[str]]]:
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, event_type: str, keywords: List[str]):
+        self.entries[key] = (event_type, keywords)
+        self.entries.move_to_end(key)
+
+    def save(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        write_json_atomic(self.path, {
+            "rules_version": self.version,
+            "entries": [[k, t, kws] for k, (t, kws) in self.entries.items()],
+        })
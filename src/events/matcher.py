@@ -0,0 +1,137 @@
+# src/events/matcher.py
+"""
+Aho-Corasick multi-pattern matcher.
+
+All keywords are compiled once into a single automaton; scanning a text
+reports every keyword that occurs in it (plain substring semantics, same
+as `kw in text`) in one linear pass, however many keywords there are.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+
+    __slots__ = ("goto", "fail", "out", "patterns")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[Tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    # --------------------------
+    # Build
+    # --------------------------
+    def _add(self, pattern: str):
+        pid = len(self.patterns)
+        self.patterns.append(pattern)
+        if not pattern:
+            return
+
+        node = 0
+        for ch in pattern:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(())
+            node = nxt
+        self.out[node] += (pid,)
+
+    def _link(self):
+        """Breadth-first failure links; outputs are merged along them."""
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                if self.out[self.fail[nxt]]:
+                    self.out[nxt] += self.out[self.fail[nxt]]
+
+    # --------------------------
+    # Scan
+    # --------------------------
+    def find_all(self, text: str) -> Set[int]:
+        """Ids of every pattern occurring in text."""
+        goto, fail, out = self.goto, self.fail, self.out
+        found: Set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class QGramFilter:
+    """
+    Inverted bigram index over phrases, used as a safe prefilter for
+    fuzz.partial_ratio(phrase, text) >= min_score.
+
+    partial_ratio >= min_score needs some window of the text that matches
+    at least that share of the phrase's characters. Every unmatched phrase
+    character breaks at most two bigrams of the phrase, and every extra
+    character in the window breaks at most one. So a phrase of length L
+    with D distinct bigrams must share at least D - 3 * floor(u * L)
+    distinct bigrams with the text, where u is the allowed unmatched
+    fraction. Phrases below that count cannot reach the score and are
+    never handed to the fuzzy scorer.
+    """
+
+    __slots__ = ("phrases", "index", "needed", "always")
+
+    def __init__(self, phrases: Iterable[str], min_score: int = 80):
+        # fuzzywuzzy rounds 100 * ratio, so 80 really means ratio >= 0.795
+        unmatched = 1 - (min_score - 0.5) / 100
+
+        self.phrases: List[str] = []
+        self.index: Dict[str, List[int]] = {}
+        self.needed: List[int] = []
+        self.always: List[int] = []
+
+        for pid, phrase in enumerate(phrases):
+            self.phrases.append(phrase)
+            grams = qgrams(phrase)
+            need = len(grams) - 3 * int(unmatched * len(phrase))
+            self.needed.append(need)
+            if need <= 0:
+                self.always.append(pid)
+                continue
+            for g in grams:
+                self.index.setdefault(g, []).append(pid)
+
+    def candidates(self, text: str) -> Set[int]:
+        """Ids of phrases that can still reach min_score against text."""
+        counts: Dict[int, int] = {}
+        for g in qgrams(text):
+            for pid in self.index.get(g, ()):
+                counts[pid] = counts.get(pid, 0) + 1
+
+        needed = self.needed
+        found = {pid for pid, c in counts.items() if c >= needed[pid]}
+        found.update(self.always)
+
+        # partial_ratio swaps roles when the text is the shorter string
+        n = len(text)
+        found.update(pid for pid, p in enumerate(self.phrases) if len(p) > n)
+        return found
+
+
+def qgrams(s: str) -> Set[str]:
+    return {s[i:i + 2] for i in range(len(s) - 1)}
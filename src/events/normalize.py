@@ -1,11 +1,16 @@
 # src/events/normalize.py
 
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
 
-from .schema import Event, make_event_id, now_utc_iso
+from .schema import Event, make_event_id
 from src.utils.region import NATIONAL, detect_districts
+from src.utils.timeparse import epoch_to_iso, first_timestamp, to_epoch
+from src.utils.script import detect_scripts
 
 DATA_RAW_DIR = Path("data/raw")
 DATA_PROCESSED_DIR = Path("data/processed")
@@ -24,11 +29,13 @@ def load_json(path: Path):
 
 def normalize_gov_news() -> List[Event]:
     path = DATA_RAW_DIR / "government_news.json"
-    data = load_json(path) or []
+    return gov_news_events(load_json(path) or [])
+
 
+def gov_news_events(items: List[dict]) -> List[Event]:
     events = []
 
-    for item in data:
+    for item in items:
 
         # Extract summary or fallback
         summary = (
@@ -45,18 +52,22 @@ def normalize_gov_news() -> List[Event]:
         # Detect districts using NLP (optional)
         districts = detect_districts(item.get("title", "") + " " + summary) or [NATIONAL]
 
+        ts, iso = first_timestamp(item.get("published"), item.get("fetched_at"))
+
         ev = Event(
-            id=make_event_id(),
+            id=make_event_id("gov", item.get("url") or item.get("title", ""), ts),
             source_type="gov",
             raw_source=item.get("source", "Government"),
             title=item.get("title", "").strip(),
             summary=summary.strip(),
             url=item.get("url"),
-            timestamp=item.get("published") or item.get("fetched_at") or now_utc_iso(),
+            timestamp=iso,
+            ts=ts,
             event_type=None,
             severity=None,
             districts=districts,
             tags=["government", "official"],
+            scripts=detect_scripts(item.get("title", "") + " " + summary),
             extra={"source": item.get("source", "gov")}
         )
         events.append(ev)
@@ -70,11 +81,13 @@ def normalize_gov_news() -> List[Event]:
 
 def normalize_media_news() -> List[Event]:
     path = DATA_RAW_DIR / "sri_lanka_news.json"
-    data = load_json(path) or []
+    return media_news_events(load_json(path) or [])
+
 
+def media_news_events(items: List[dict]) -> List[Event]:
     events = []
 
-    for item in data:
+    for item in items:
 
         # Extract summary or fallback
         summary = (
@@ -90,18 +103,22 @@ def normalize_media_news() -> List[Event]:
 
         districts = detect_districts(item.get("title", "") + " " + summary) or [NATIONAL]
 
+        ts, iso = first_timestamp(item.get("published"), item.get("timestamp"))
+
         ev = Event(
-            id=make_event_id(),
+            id=make_event_id(item.get("source", "news"), item.get("link") or item.get("title", ""), ts),
             source_type=item.get("source", "news"),
             raw_source=item.get("source", "news"),
             title=item.get("title", "").strip(),
             summary=summary.strip(),
             url=item.get("link"),
-            timestamp=item.get("published") or now_utc_iso(),
+            timestamp=iso,
+            ts=ts,
             event_type=None,
             severity=None,
             districts=districts,
             tags=["news"],
+            scripts=detect_scripts(item.get("title", "") + " " + summary),
             extra={"summary_length": len(summary)}
         )
         events.append(ev)
@@ -113,6 +130,92 @@ def normalize_media_news() -> List[Event]:
 # 3. WEATHER EVENTS (NEW + OLD FORMAT SUPPORTED)
 # ============================================================
 
+# (field, threshold, event_type, title prefix, tags)
+WEATHER_ALERTS = [
+    ("rain_3h", 20, "Heavy Rain", "Heavy rain alert in", ["weather", "rain"]),
+    ("wind_speed", 40, "Strong Wind", "Strong wind alert in", ["weather", "wind"]),
+]
+
+
+def weather_summary(item: dict) -> str:
+    warnings = item.get("warnings", [])
+    return (
+        f"Temp: {item.get('temperature')}°C, "
+        f"Wind: {item.get('wind_speed')} km/h, "
+        f"Rain1h: {item.get('rain_1h')} mm, "
+        f"Rain3h: {item.get('rain_3h')} mm, "
+        f"Humidity: {item.get('humidity')}%, "
+        f"Warnings: {', '.join(warnings) if warnings else 'None'}"
+    )
+
+
+def weather_history_events(records: List[dict]) -> List[Event]:
+    """
+    The raw file is an accumulated history (up to 8000 records).
+    Emit only:
+      - the latest observation per district
+      - an alert each time a threshold is newly crossed
+    Every event keeps the observation time of the record it came from;
+    legacy records without a timestamp stay unknown (ts None) instead of
+    being stamped with the ingest time.
+    """
+    by_district = {}
+    for item in records:
+        ts = to_epoch(item.get("timestamp"))
+        iso = epoch_to_iso(ts) if ts is not None else None
+        by_district.setdefault(item.get("district", "Unknown"), []).append((ts, iso, item))
+
+    events = []
+
+    for district, history in by_district.items():
+        # stable sort: untimestamped records first, in file order, so the
+        # latest observation and the crossing order come from dated records
+        history.sort(key=lambda h: (h[0] is not None, h[0] or 0))
+
+        # Threshold crossings (below → above)
+        above = {field: False for field, *_ in WEATHER_ALERTS}
+        for ts, iso, item in history:
+            for field, threshold, etype, prefix, tags in WEATHER_ALERTS:
+                now_above = (item.get(field) or 0) >= threshold
+                if now_above and not above[field]:
+                    events.append(Event(
+                        id=make_event_id("weather", district, etype, ts),
+                        source_type="weather",
+                        raw_source="OpenWeather",
+                        title=f"{prefix} {district}",
+                        summary=weather_summary(item),
+                        url=None,
+                        timestamp=iso,
+                        ts=ts,
+                        event_type=etype,
+                        severity=None,
+                        districts=[district],
+                        tags=tags,
+                        extra=item
+                    ))
+                above[field] = now_above
+
+        # Latest observation
+        ts, iso, item = history[-1]
+        events.append(Event(
+            id=make_event_id("weather", district, "update", ts),
+            source_type="weather",
+            raw_source="OpenWeather",
+            title=f"Weather update for {district}",
+            summary=weather_summary(item),
+            url=None,
+            timestamp=iso,
+            ts=ts,
+            event_type=None,
+            severity=None,
+            districts=[district],
+            tags=["weather"],
+            extra=item
+        ))
+
+    return events
+
+
 def normalize_weather() -> List[Event]:
     path = DATA_RAW_DIR / "srilanka_weather.json"
     data = load_json(path) or []
@@ -121,89 +224,28 @@ def normalize_weather() -> List[Event]:
 
     # NEW FORMAT (LIST OF RECORDS)
     if isinstance(data, list):
-        for item in data:
-
-            district = item.get("district", "Unknown")
-            warnings = item.get("warnings", [])
-
-            # Build summary from values
-            summary = (
-                f"Temp: {item.get('temperature')}°C, "
-                f"Wind: {item.get('wind_speed')} km/h, "
-                f"Rain1h: {item.get('rain_1h')} mm, "
-                f"Rain3h: {item.get('rain_3h')} mm, "
-                f"Humidity: {item.get('humidity')}%, "
-                f"Warnings: {', '.join(warnings) if warnings else 'None'}"
-            )
-
-            # Base event
-            events.append(Event(
-                id=make_event_id(),
-                source_type="weather",
-                raw_source="OpenWeather",
-                title=f"Weather update for {district}",
-                summary=summary,
-                url=None,
-                timestamp=now_utc_iso(),
-                event_type=None,
-                severity=None,
-                districts=[district],
-                tags=["weather"],
-                extra=item
-            ))
-
-            # Weather alert types
-            if item.get("rain_3h", 0) >= 20:
-                events.append(Event(
-                    id=make_event_id(),
-                    source_type="weather",
-                    raw_source="OpenWeather",
-                    title=f"Heavy rain alert in {district}",
-                    summary=summary,
-                    url=None,
-                    timestamp=now_utc_iso(),
-                    event_type="Heavy Rain",
-                    severity=None,
-                    districts=[district],
-                    tags=["weather", "rain"],
-                    extra=item
-                ))
-
-            if item.get("wind_speed", 0) >= 40:
-                events.append(Event(
-                    id=make_event_id(),
-                    source_type="weather",
-                    raw_source="OpenWeather",
-                    title=f"Strong wind alert in {district}",
-                    summary=summary,
-                    url=None,
-                    timestamp=now_utc_iso(),
-                    event_type="Strong Wind",
-                    severity=None,
-                    districts=[district],
-                    tags=["weather", "wind"],
-                    extra=item
-                ))
-
-        return events
+        return weather_history_events(data)
 
     # OLD FORMAT (DICT OF DISTRICTS)
     if isinstance(data, dict):
         for district, info in data.items():
             warnings = info.get("warnings", [])
             summary = info.get("weather_description", "")
+            ts = to_epoch(info.get("timestamp"))     # None = unknown, never the ingest time
+            iso = epoch_to_iso(ts) if ts is not None else None
 
             if not summary.strip():
                 summary = f"Weather conditions: {warnings}"
 
             events.append(Event(
-                id=make_event_id(),
+                id=make_event_id("weather", district, "update", ts),
                 source_type="weather",
                 raw_source="OpenWeather",
                 title=f"Weather update for {district}",
                 summary=summary,
                 url=None,
-                timestamp=now_utc_iso(),
+                timestamp=iso,
+                ts=ts,
                 event_type=None,
                 severity=None,
                 districts=[district],
@@ -220,20 +262,63 @@ def normalize_weather() -> List[Event]:
 # MAIN BUILDER
 # ============================================================
 
-def main():
+# Raw file + per-chunk normalizer for every chunkable source
+CHUNKED_SOURCES = [
+    ("government_news.json", gov_news_events),
+    ("sri_lanka_news.json", media_news_events),
+]
+
+CHUNK_SIZE = 500
+
+
+def _normalize_chunk(task) -> List[dict]:
+    """Worker entry point: (normalizer, raw items) → event dicts."""
+    normalizer, items = task
+    return [e.to_dict() for e in normalizer(items)]
+
+
+def build_tasks() -> list:
+    """Split every raw source into chunks, in deterministic output order."""
+    tasks = []
+    for filename, normalizer in CHUNKED_SOURCES:
+        items = load_json(DATA_RAW_DIR / filename) or []
+        for start in range(0, len(items), CHUNK_SIZE):
+            tasks.append((normalizer, items[start:start + CHUNK_SIZE]))
+    return tasks
+
+
+def normalize_all(workers: int = 1) -> List[dict]:
+    tasks = build_tasks()
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            # map() yields results in submission order → deterministic merge
+            chunks = list(pool.map(_normalize_chunk, tasks))
+    else:
+        chunks = [_normalize_chunk(t) for t in tasks]
+
+    all_events = [ev for chunk in chunks for ev in chunk]
+
+    # weather history is small and order-dependent → kept in-process
+    all_events += [e.to_dict() for e in normalize_weather()]
+    return all_events
+
+
+def main(workers: int = 1):
     DATA_PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-    all_events: List[Event] = []
-    all_events += normalize_gov_news()
-    all_events += normalize_media_news()
-    all_events += normalize_weather()
+    all_events = normalize_all(workers)
 
     out_path = DATA_PROCESSED_DIR / "events.json"
     with open(out_path, "w", encoding="utf-8") as f:
-        json.dump([e.to_dict() for e in all_events], f, indent=2, ensure_ascii=False)
+        json.dump(all_events, f, indent=2, ensure_ascii=False)
 
-    print(f"Saved {len(all_events)} normalized events → {out_path}")
+    print(f"Saved {len(all_events)} normalized events → {out_path} (workers={workers})")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Normalize raw collector output into events.json")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="process pool size (1 = run in-process)")
+    args = parser.parse_args()
+    main(args.workers)
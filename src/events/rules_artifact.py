@@ -0,0 +1,69 @@
+# src/events/rules_artifact.py
+"""
+Prebuilt classifier rule artifacts.
+
+Compiling ADVANCED_RULES into automata / stem indexes / bigram filters
+costs far more than unpickling the result, and every short-lived pipeline
+or worker process would otherwise repeat it. The compiled structures are
+pickled once to data/cache/rules-<rules version>-<source hash>.pkl and
+unpickled on startup (a plain pickle cache: each process still gets its
+own copy of the objects).
+
+The file name carries both the rules version and a hash of the matcher,
+stem_index and script module sources, so a change to the keyword rules
+or to the code that builds the pickled classes never loads a stale
+automaton (stale files are removed on the next save).
+"""
+
+import os
+import pickle
+from functools import lru_cache
+from hashlib import sha1
+from pathlib import Path
+from typing import Optional
+
+from src.utils import script
+from . import matcher, stem_index
+
+ARTIFACT_DIR = Path("data/cache")
+
+# modules whose classes end up inside the pickled artifact
+COMPILED_MODULES = (matcher, stem_index, script)
+
+
+@lru_cache(maxsize=1)
+def source_hash() -> str:
+    h = sha1()
+    for module in COMPILED_MODULES:
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()[:12]
+
+
+def artifact_path(version: str) -> Path:
+    return ARTIFACT_DIR / f"rules-{version}-{source_hash()}.pkl"
+
+
+def load_artifact(version: str) -> Optional[dict]:
+    path = artifact_path(version)
+    if not path.exists():
+        return None
+    try:
+        return pickle.loads(path.read_bytes())
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def save_artifact(compiled: dict, version: str) -> Path:
+    ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+    path = artifact_path(version)
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+    # older rule versions / sources can never be loaded again
+    for old in ARTIFACT_DIR.glob("rules-*.pkl"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return path
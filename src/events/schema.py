@@ -3,9 +3,12 @@
 from dataclasses import dataclass, asdict, field
 from typing import List, Optional, Dict
 from uuid import uuid4
+from hashlib import sha1
 from datetime import datetime
 
-@dataclass
+from src.utils.timeparse import parse_timestamp
+
+@dataclass(slots=True)
 class Event:
     id: str
     source_type: str          # 'gov', 'news', 'weather', 'youtube', 'gdelt'
@@ -13,20 +16,38 @@ class Event:
     title: str
     summary: str
     url: Optional[str]
-    timestamp: str            # ISO string
+    timestamp: Optional[str]  # canonical ISO string (UTC); None = unknown
+    ts: Optional[int]         # UTC epoch seconds, parsed once at ingest; None = unknown
     event_type: Optional[str] = None     # will be filled by classifier later
     severity: Optional[float] = None     # will be filled by scorer later
     districts: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
+    scripts: List[str] = field(default_factory=list)   # 'latin', 'sinhala', 'tamil'
     extra: Dict = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
         return asdict(self)
 
 
-def make_event_id() -> str:
-    return f"EVT-{uuid4().hex[:12].upper()}"
+def make_event_id(*key_parts) -> str:
+    """
+    With key parts the id is a stable hash, so re-normalizing the same raw
+    item gives the same id (needed to merge into stored partitions).
+    Without key parts a random id is returned.
+    """
+    if not key_parts:
+        return f"EVT-{uuid4().hex[:12].upper()}"
+    key = "\x1f".join(str(p) for p in key_parts)
+    return f"EVT-{sha1(key.encode('utf-8')).hexdigest()[:12].upper()}"
 
 
 def now_utc_iso() -> str:
     return datetime.utcnow().isoformat() + "Z"
+
+
+def event_epoch(event: Dict) -> Optional[int]:
+    """Epoch set at ingest; older events.json files only carry the string."""
+    ts = event.get("ts")
+    if ts is None:
+        ts = parse_timestamp(event.get("timestamp"))
+    return ts
@@ -1,8 +1,12 @@
 # src/events/severity.py
 
-import json
 from pathlib import Path
-from datetime import datetime, timedelta,timezone
+
+import numpy as np
+
+from src.utils.timeparse import now_epoch
+from .schema import event_epoch
+from .table import EventTable
 
 EVENTS_PATH = Path("data/processed/events.json")
 
@@ -59,30 +63,15 @@ EVENT_TYPE_WEIGHTS = {
 # ------------------------------
 # Recency decay (events lose strength over time)
 # ------------------------------
-from datetime import datetime, timedelta, timezone
-
-def recency_weight(timestamp_str):
-    if not timestamp_str:
+def recency_weight(ts, now=None):
+    # None and 0 both mean "no timestamp", as in recency_weights
+    if not ts:
         return 1.0
 
-    try:
-        # Convert Z → +00:00 for ISO parsing
-        clean = timestamp_str.replace("Z", "+00:00")
-
-        ts = datetime.fromisoformat(clean)
-
-        # If timestamp is naive, make it UTC
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-
-        # Current time as timezone-aware UTC
-        now = datetime.now(timezone.utc)
+    if now is None:
+        now = now_epoch()
 
-        hours_old = (now - ts).total_seconds() / 3600
-
-    except Exception as e:
-        # fallback if parsing fails
-        return 1.0
+    hours_old = (now - ts) / 3600
 
     if hours_old < 1:
         return 1.0
@@ -95,6 +84,26 @@ def recency_weight(timestamp_str):
     return 0.1
 
 
+# (upper bound in hours, weight) — same steps as recency_weight
+RECENCY_STEPS = [(1, 1.0), (6, 0.8), (24, 0.6), (72, 0.3)]
+RECENCY_FLOOR = 0.1
+
+
+def recency_weights(ts: np.ndarray, now=None) -> np.ndarray:
+    """Vector recency_weight; ts == 0 means unknown (weight 1.0)."""
+    if now is None:
+        now = now_epoch()
+
+    hours_old = (now - ts) / 3600
+    bounds = np.array([h for h, _ in RECENCY_STEPS], dtype=np.float64)
+    levels = np.array([w for _, w in RECENCY_STEPS] + [RECENCY_FLOOR])
+
+    # first step whose bound is > hours_old, same as the if-chain
+    weights = levels[np.searchsorted(bounds, hours_old, side="right")]
+    weights[ts == 0] = 1.0
+    return weights
+
+
 
 # ------------------------------
 # Weather intensity scoring
@@ -110,10 +119,23 @@ def compute_weather_intensity(event):
     return max(rain_intensity, wind_intensity)
 
 
+def weather_intensities(extras) -> np.ndarray:
+    """Vector compute_weather_intensity over a column of extra dicts."""
+    n = len(extras)
+    rain = np.zeros(n, dtype=np.float64)
+    wind = np.zeros(n, dtype=np.float64)
+    for i, extra in enumerate(extras):
+        if extra:
+            rain[i] = extra.get("rain_1h") or extra.get("rain_3h") or 0
+            wind[i] = extra.get("wind_speed", 0)
+
+    return np.maximum(np.minimum(rain / 30, 1.0), np.minimum(wind / 70, 1.0))
+
+
 # ------------------------------
 # Final severity calculation
 # ------------------------------
-def compute_severity(event):
+def compute_severity(event, now=None):
     source = event.get("source_type", "general")
     etype = event.get("event_type", "General")
 
@@ -128,7 +150,7 @@ def compute_severity(event):
 
     weather_intensity = compute_weather_intensity(event)
 
-    recency = recency_weight(event.get("timestamp"))
+    recency = recency_weight(event_epoch(event), now)
 
     severity = (
         0.30 * source_w +
@@ -143,6 +165,82 @@ def compute_severity(event):
     return round(severity, 2)
 
 
+def _round2(x: np.ndarray) -> np.ndarray:
+    """round(x, 2) with Python's semantics.
+
+    np.round scales by 100 first, which can tip values that sit right at a
+    half-cent the other way; those few are re-rounded in Python.
+    """
+    out = np.round(x, 2)
+    frac = x * 100 - np.floor(x * 100)
+    for i in np.flatnonzero(np.abs(frac - 0.5) < 1e-6):
+        out.flat[i] = round(float(x.flat[i]), 2)
+    return out
+
+
+# Term weights of compute_severity, in evaluation order
+SEVERITY_TERMS = ["source", "type", "trend", "confidence", "weather", "recency"]
+SEVERITY_TERM_WEIGHTS = [0.30, 0.25, 0.15, 0.15, 0.10, 0.05]
+
+
+def severity_terms(table: EventTable, now=None, recency: bool = True) -> np.ndarray:
+    """events × SEVERITY_TERMS matrix of the unweighted severity inputs.
+
+    recency=False leaves out the trailing recency column.
+    """
+    source_lut = np.array([SOURCE_WEIGHTS.get(n, 0.5) for n in table.sources.names])
+    # trailing 0.2 is picked up by type_code == -1 (unclassified)
+    type_lut = np.array([EVENT_TYPE_WEIGHTS.get(n, 0.2) for n in table.types.names] + [0.2])
+
+    trend_strength = np.where(np.isnan(table.trend), 1, table.trend)
+
+    columns = [
+        source_lut[table.source_code],
+        type_lut[table.type_code],
+        np.minimum((trend_strength - 1) / 15, 0.4),
+        np.where(np.isnan(table.confidence), 0.5, table.confidence),
+        weather_intensities(table.extra),
+    ]
+    if recency:
+        columns.append(recency_weights(table.ts, now))
+    return np.column_stack(columns)
+
+
+def static_severity_table(table: EventTable, terms: np.ndarray = None) -> np.ndarray:
+    """Every severity term except recency, uncapped and unrounded.
+
+    This part does not change as an event ages, so it is stored with the
+    event and the recency term is added whenever severity is read.
+    """
+    if terms is None:
+        terms = severity_terms(table, recency=False)
+    source_w, type_w, trend_score, confidence, weather_intensity = terms[:, :5].T
+
+    return (
+        0.30 * source_w +
+        0.25 * type_w +
+        0.15 * trend_score +
+        0.15 * confidence +
+        0.10 * weather_intensity
+    )
+
+
+def severity_at(static: np.ndarray, recency: np.ndarray, weight=0.05) -> np.ndarray:
+    """Final severity from the static part and a recency weight (broadcasts).
+
+    `weight` is the recency term weight; what-if scenarios pass their own.
+    """
+    return _round2(np.minimum(static + weight * recency, 0.85))
+
+
+def compute_severity_table(table: EventTable, now=None) -> np.ndarray:
+    """compute_severity for every row of an EventTable, as one array.
+
+    Weights are gathered by categorical code and every term is evaluated in
+    the same order as compute_severity, so results are bit-identical.
+    """
+    return severity_at(static_severity_table(table), recency_weights(table.ts, now))
+
 
 # ------------------------------
 # Apply severity to all events
@@ -152,16 +250,12 @@ def apply_severity():
         print("events.json not found!")
         return
 
-    with open(EVENTS_PATH, "r", encoding="utf-8") as f:
-        events = json.load(f)
-
-    for ev in events:
-        ev["severity"] = compute_severity(ev)
-
-    with open(EVENTS_PATH, "w", encoding="utf-8") as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    table = EventTable.load(EVENTS_PATH)
+    table.severity_static = static_severity_table(table)
+    table.severity = severity_at(table.severity_static, recency_weights(table.ts, now_epoch()))
+    table.save(EVENTS_PATH)
 
-    print(f"Upgraded severity scoring complete for {len(events)} events.")
+    print(f"Upgraded severity scoring complete for {len(table)} events.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+# src/events/stem_index.py
+"""
+Stemmed-token phrase index for English keywords.
+
+Keywords are compiled into sequences of Porter stems, indexed by their
+first stem. A text is tokenized and stemmed once (the stemmer is
+memoized), then every position is looked up in the index and compared
+token-by-token. So "flood" covers "floods", "flooded" and "flooding"
+without separate rule entries, and phrases match by token sequence
+instead of by raw substring.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_stemmer = None
+
+
+@lru_cache(maxsize=None)
+def stem(token: str) -> str:
+    global _stemmer
+    if _stemmer is None:
+        from nltk.stem import PorterStemmer   # heavy import, only when needed
+        _stemmer = PorterStemmer()
+    return _stemmer.stem(token)
+
+
+def stem_tokens(text: str) -> List[str]:
+    """Stems of the ASCII word tokens of an already-lowercased text."""
+    return [stem(t) for t in _TOKEN_RE.findall(text)]
+
+
+class StemPhraseIndex:
+
+    __slots__ = ("phrases", "index")
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: List[str] = []
+        self.index: Dict[str, List[Tuple[Tuple[str, ...], int]]] = {}
+
+        for pid, phrase in enumerate(phrases):
+            self.phrases.append(phrase)
+            seq = tuple(stem_tokens(phrase))
+            if seq:
+                self.index.setdefault(seq[0], []).append((seq, pid))
+
+    def find_all(self, text: str) -> Set[int]:
+        """Ids of every phrase whose stem sequence occurs in text."""
+        stems = stem_tokens(text)
+        found: Set[int] = set()
+        n = len(stems)
+        for i, s in enumerate(stems):
+            for seq, pid in self.index.get(s, ()):
+                k = len(seq)
+                if k == 1 or (i + k <= n and tuple(stems[i:i + k]) == seq):
+                    found.add(pid)
+        return found
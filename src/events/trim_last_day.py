@@ -1,10 +1,19 @@
+import argparse
 import json
-from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from . import store
+
 EVENTS_PATH = Path("data/processed/events.json")
 
-def trim_last_day():
+WINDOW_HOURS = 48
+
+def trim_last_day(hours: float = WINDOW_HOURS):
+    """
+    Files the freshly normalized events into the partitioned store, drops
+    expired partitions, then materializes the requested window back into
+    events.json for the downstream stages. History stays in the store.
+    """
     if not EVENTS_PATH.exists():
         print("events.json not found.")
         return
@@ -12,20 +21,23 @@ def trim_last_day():
     with open(EVENTS_PATH, "r", encoding="utf-8") as f:
         events = json.load(f)
 
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(days=2)
+    manifest = store.append_events(events)
+    dropped = store.apply_retention()
 
-    kept = []
-    for ev in events:
-        ts = ev.get("timestamp", "")
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "")).replace(tzinfo=timezone.utc)
-            if dt >= cutoff:
-                kept.append(ev)
-        except:
-            kept.append(ev)
+    kept = store.read_window(hours)
 
     with open(EVENTS_PATH, "w", encoding="utf-8") as f:
         json.dump(kept, f, indent=2, ensure_ascii=False)
 
-    print(f"[trim] Kept {len(kept)} events (last 24h)")
+    undated = manifest["partitions"].get(store.UNKNOWN_PARTITION, {}).get("count", 0)
+    print(
+        f"[trim] Kept {len(kept)} events (last {hours:g}h, {undated} without a timestamp) · "
+        f"{len(manifest['partitions']) - dropped} partitions stored, {dropped} expired"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Window events.json from the partitioned store")
+    parser.add_argument("--hours", type=float, default=WINDOW_HOURS)
+    args = parser.parse_args()
+    trim_last_day(args.hours)
@@ -0,0 +1,403 @@
+# src/industry/accumulators.py
+"""
+Incremental sliding-window score accumulators.
+
+The fused engine rescores every event on every run. This keeps running
+state in data/cache/score_accumulators.json instead:
+
+    national   industry          risk / opp raw sums + driver order
+    areas      (district|province) × industry  — same
+
+plus, per event in the window, the inputs it was scored from (type,
+static severity, districts, ts) and the recency level it is counted at.
+A refresh compares events.json against those inputs and only touches the
+sums and driver lists for events that are:
+
+    new          added
+    changed      old contribution subtracted, new one added (seq kept)
+    gone         dropped from events.json → subtracted
+    expired      ts (or, without a ts, the run that first saw the event)
+                 older than the window → subtracted
+    re-levelled  crossed a recency step (1h / 6h / 24h / 72h) → moved
+
+Severity is rebuilt from severity_static at the refresh's `now`, the same
+way severity.apply_severity does, so the published scores track the
+engine's to float rounding (add/subtract order differs; --resync clears
+the drift). Clamping (risk ≤ 0.8 etc.) and levels are applied when
+scores are read, never to the stored sums.
+
+Cost: the comparison against events.json is one dict lookup and tuple
+compare per listed event, so a refresh is still linear in the window;
+the numeric work (sums, driver inserts/removals) is proportional to the
+events that changed. Loading the state re-sorts the driver lists from
+the stored inputs.
+
+    python -m src.industry.accumulators            # refresh from events.json
+    python -m src.industry.accumulators --publish  # ... and write score files
+"""
+
+import argparse
+import bisect
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.events.severity import severity_at, static_severity_table
+from src.events.store import write_json_atomic
+from src.events.table import EventTable
+from src.events.trim_last_day import WINDOW_HOURS
+from src.utils.timeparse import now_epoch
+from .engine import (
+    DISTRICT_PATH, INDUSTRY_PATH, PROVINCE_PATH, level, province_location_rows, publish_outputs,
+    summarize_cells,
+)
+from .footprint import PROVINCE_MAP
+from .live import CUT_SECONDS, LEVELS
+from .matrix import (
+    district_location_rows, event_location_factors, exposure_vector, sensitivity_rows,
+)
+from .score_district import ALL_DISTRICTS
+from .sensitivity import INDUSTRIES
+
+EVENTS_PATH = Path("data/processed/events.json")
+STATE_PATH = Path("data/cache/score_accumulators.json")
+
+STATE_VERSION = 2
+TOP_K = 3
+
+# area index space: districts, then provinces, then the national row
+AREAS = ALL_DISTRICTS + list(PROVINCE_MAP)
+NATIONAL_AREA = len(AREAS)
+
+_DISTRICT_AREA = {d: i for i, d in enumerate(ALL_DISTRICTS)}
+_PROVINCE_AREA = {d: len(ALL_DISTRICTS) + p
+                  for p, districts in enumerate(PROVINCE_MAP.values()) for d in districts}
+
+# (national clamp, area clamp) for (risk, opp), as in score.py / score_district.py
+NATIONAL_CAPS = (0.8, 0.85)
+AREA_CAPS = (1.0, 1.0)
+
+
+def recency_levels(ts: np.ndarray, now: int) -> np.ndarray:
+    """Index into live.LEVELS of each event's recency weight; ts == 0 counts as fresh."""
+    levels = np.searchsorted(CUT_SECONDS, now - ts, side="right")
+    levels[ts == 0] = 0
+    return levels
+
+
+class ScoreAccumulators:
+
+    def __init__(self, window_hours: float = WINDOW_HOURS, k: int = TOP_K,
+                 path: Path = STATE_PATH):
+        self.path = path
+        self.window_hours = window_hours
+        self.k = k
+
+        shape = (len(AREAS) + 1, len(INDUSTRIES))
+        self.risk = np.zeros(shape)
+        self.opp = np.zeros(shape)
+        # contributions per cell on each side; a side with none reads as a plain 0
+        self.n_risk = np.zeros(shape, dtype=np.int64)
+        self.n_opp = np.zeros(shape, dtype=np.int64)
+        self.count = np.zeros(len(AREAS) + 1, dtype=np.int64)
+
+        # (area, industry) -> [(-|impact|, seq, event_id, impact)] sorted, every event
+        # in the cell; seq breaks ties towards the earlier event like the engine's stable sort
+        self.drivers: Dict[Tuple[int, int], List[Tuple[float, int, str, float]]] = {}
+
+        # event_id -> {"seq", "ts", "entered", "title", "type", "static", "districts",
+        #              "loc": [I], "areas": [idx], "level"}
+        self.events: Dict[str, Dict] = {}
+        # untimestamped ids that aged out while events.json still lists them
+        self.retired: Dict[str, int] = {}
+        self.next_seq = 0
+
+        self.area_loc = np.vstack([district_location_rows(ALL_DISTRICTS), province_location_rows()])
+        self.exposure = exposure_vector()
+        self._sens: Dict[str, np.ndarray] = {}
+
+    # --------------------------
+    # Persistence
+    # --------------------------
+    @classmethod
+    def load(cls, path: Path = STATE_PATH, window_hours: float = WINDOW_HOURS,
+             k: int = TOP_K) -> "ScoreAccumulators":
+        acc = cls(window_hours, k, path)
+        if not path.exists():
+            return acc
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return acc
+
+        # stored sums only make sense for the same layout, window and driver count
+        if (data.get("version") != STATE_VERSION or data.get("window_hours") != window_hours
+                or data.get("k") != k):
+            return acc
+
+        acc.risk = np.array(data["risk"])
+        acc.opp = np.array(data["opp"])
+        acc.n_risk = np.array(data["n_risk"], dtype=np.int64)
+        acc.n_opp = np.array(data["n_opp"], dtype=np.int64)
+        acc.count = np.array(data["count"], dtype=np.int64)
+        acc.events = data["events"]
+        acc.retired = data["retired"]
+        acc.next_seq = data["next_seq"]
+        acc._index_drivers()
+        return acc
+
+    def save(self):
+        write_json_atomic(self.path, {
+            "version": STATE_VERSION,
+            "window_hours": self.window_hours,
+            "k": self.k,
+            "risk": self.risk.tolist(),
+            "opp": self.opp.tolist(),
+            "n_risk": self.n_risk.tolist(),
+            "n_opp": self.n_opp.tolist(),
+            "count": self.count.tolist(),
+            "events": self.events,
+            "retired": self.retired,
+            "next_seq": self.next_seq,
+        })
+
+    def _index_drivers(self):
+        """Driver lists are derived from the stored events, so they are rebuilt, not saved."""
+        self.drivers = {}
+        for event_id, rec in self.events.items():
+            for area, impacts in self._contributions(rec):
+                for j, impact in enumerate(impacts):
+                    item = (-abs(float(impact)), rec["seq"], event_id, float(impact))
+                    self.drivers.setdefault((area, j), []).append(item)
+        for cell in self.drivers.values():
+            cell.sort()
+
+    # --------------------------
+    # Contributions
+    # --------------------------
+    def _sens_row(self, event_type: str) -> np.ndarray:
+        row = self._sens.get(event_type)
+        if row is None:
+            row = self._sens[event_type] = sensitivity_rows([event_type])[0][0]
+        return row
+
+    def _contributions(self, rec: Dict) -> Iterator[Tuple[int, np.ndarray]]:
+        """(area, impacts) for every cell row the event counts in, as engine.score_all."""
+        sev = severity_at(np.array([rec["static"]]), LEVELS[rec["level"]])[0]
+        base = sev * self._sens_row(rec["type"])
+
+        national = (base * np.asarray(rec["loc"])) / 2
+        national *= self.exposure
+        yield NATIONAL_AREA, national
+        for area in rec["areas"]:
+            yield area, base * self.area_loc[area]
+
+    def _apply(self, rec: Dict, event_id: str, sign: int):
+        """Add (sign=+1) or subtract (sign=-1) one event's contributions."""
+        for area, impacts in self._contributions(rec):
+            positive = impacts > 0
+            self.opp[area] += sign * np.where(positive, impacts, 0.0)
+            self.risk[area] += sign * np.where(positive, 0.0, np.abs(impacts))
+            self.n_opp[area] += sign * positive
+            self.n_risk[area] += sign * ~positive
+            self.count[area] += sign
+
+            # a side with no contributions left is exactly 0: drop accumulated rounding drift
+            self.opp[area][self.n_opp[area] == 0] = 0.0
+            self.risk[area][self.n_risk[area] == 0] = 0.0
+
+            for j, impact in enumerate(impacts):
+                item = (-abs(float(impact)), rec["seq"], event_id, float(impact))
+                cell = self.drivers.setdefault((area, j), [])
+                if sign > 0:
+                    bisect.insort(cell, item)
+                else:
+                    i = bisect.bisect_left(cell, item)
+                    if i < len(cell) and cell[i][1] == rec["seq"]:
+                        del cell[i]
+
+    def _add(self, event_id: str, rec: Dict):
+        self.events[event_id] = rec
+        self._apply(rec, event_id, +1)
+
+    def _retract(self, event_id: str) -> Dict:
+        rec = self.events.pop(event_id)
+        self._apply(rec, event_id, -1)
+        return rec
+
+    def resync(self):
+        """Re-add every in-window event in arrival order.
+
+        Add/subtract cycles leave float drift in the sums; after a resync
+        they equal a sequential sum over the window again.
+        """
+        events = sorted(self.events.items(), key=lambda kv: kv[1]["seq"])
+        fresh = ScoreAccumulators(self.window_hours, self.k, self.path)
+        for event_id, rec in events:
+            fresh._add(event_id, rec)
+        for name in ("risk", "opp", "n_risk", "n_opp", "count", "drivers"):
+            setattr(self, name, getattr(fresh, name))
+
+    # --------------------------
+    # Window maintenance
+    # --------------------------
+    def refresh(self, table: EventTable, now: Optional[int] = None) -> Dict[str, int]:
+        """Bring the sums in line with `table` at `now`. Returns counts per kind of update."""
+        now = now_epoch() if now is None else now
+        cutoff = now - int(self.window_hours * 3600)
+        counts = dict.fromkeys(("added", "rescored", "relevelled", "removed"), 0)
+
+        static = table.severity_static
+        if np.isnan(static).any():
+            static = static_severity_table(table)
+        levels = recency_levels(table.ts, now)
+
+        # scored events by id; a later duplicate wins, as in store.read_window
+        _, scored_rows = sensitivity_rows(table.types.names)
+        listed = {table.ids[i]: int(i) for i in np.flatnonzero(scored_rows[table.type_code])}
+
+        # gone from events.json, or entered longer ago than the window
+        for event_id, rec in list(self.events.items()):
+            if event_id in listed and (rec["ts"] or rec["entered"]) >= cutoff:
+                continue
+            self._retract(event_id)
+            if not rec["ts"] and event_id in listed:
+                self.retired[event_id] = rec["entered"]
+            counts["removed"] += 1
+        self.retired = {e: t for e, t in self.retired.items() if e in listed}
+
+        pending = []            # (row, event_id, seq, entered) to score from the table
+        for event_id, i in listed.items():
+            ts = int(table.ts[i])
+            if (ts and ts < cutoff) or (not ts and event_id in self.retired):
+                continue
+            districts = [table.districts.names[c] for c in table.district_codes_of(i)]
+            inputs = (table.types.names[table.type_code[i]], float(static[i]), districts, ts)
+
+            rec = self.events.get(event_id)
+            if rec is None:
+                pending.append((i, event_id, None, now))
+                counts["added"] += 1
+            elif (rec["type"], rec["static"], rec["districts"], rec["ts"]) != inputs:
+                self._retract(event_id)
+                pending.append((i, event_id, rec["seq"], rec["entered"]))
+                counts["rescored"] += 1
+            else:
+                rec["title"] = table.title[i]
+                if rec["level"] != levels[i]:
+                    self._retract(event_id)
+                    rec["level"] = int(levels[i])
+                    self._add(event_id, rec)
+                    counts["relevelled"] += 1
+
+        if pending:
+            rows = np.array([p[0] for p in pending], dtype=np.int64)
+            loc = event_location_factors(table.take(rows))
+            for r, (i, event_id, seq, entered) in enumerate(pending):
+                if seq is None:
+                    seq = self.next_seq
+                    self.next_seq += 1
+                districts = [table.districts.names[c] for c in table.district_codes_of(i)]
+                areas = set()
+                for name in districts:
+                    if name in _DISTRICT_AREA:
+                        areas.add(_DISTRICT_AREA[name])
+                        areas.add(_PROVINCE_AREA[name])
+                self._add(event_id, {
+                    "seq": seq,
+                    "ts": int(table.ts[i]),
+                    "entered": entered,
+                    "title": table.title[i],
+                    "type": table.types.names[table.type_code[i]],
+                    "static": float(static[i]),
+                    "districts": districts,
+                    "loc": loc[r].tolist(),
+                    "areas": sorted(areas),
+                    "level": int(levels[i]),
+                })
+        return counts
+
+    # --------------------------
+    # Read-time scores
+    # --------------------------
+    def _cells(self, area: int, caps: Tuple[float, float]) -> Dict[str, Dict]:
+        cells = {}
+        for j, industry in enumerate(INDUSTRIES):
+            # like the engine, a side nothing was added to stays a plain 0
+            risk = min(max(float(self.risk[area, j]), 0.0), caps[0]) if self.n_risk[area, j] else 0
+            opp = min(max(float(self.opp[area, j]), 0.0), caps[1]) if self.n_opp[area, j] else 0
+            top = self.drivers.get((area, j), [])[:self.k]
+            refs = [{"id": item[2], "impact": round(item[3], 4)} for item in top]
+            cells[industry] = {
+                "risk_score": round(risk, 2),
+                "opp_score": round(opp, 2),
+                "risk_level": level(risk),
+                "opp_level": level(opp),
+                "top_drivers": [self.events[item[2]]["title"] for item in top],
+                "top_driver_events": refs,
+            }
+        return cells
+
+    def industry_scores(self) -> Dict:
+        return self._cells(NATIONAL_AREA, NATIONAL_CAPS)
+
+    def district_scores(self) -> Dict:
+        results = {}
+        for d, name in enumerate(ALL_DISTRICTS):
+            cells = self._cells(d, AREA_CAPS)
+            results[name] = {**cells, **summarize_cells(cells)}
+        return results
+
+    def province_scores(self) -> Dict:
+        results = {}
+        for p, (province, districts) in enumerate(PROVINCE_MAP.items()):
+            a = len(ALL_DISTRICTS) + p
+            cells = self._cells(a, AREA_CAPS)
+            summary = summarize_cells(cells)
+            summary.pop("event_count")
+            results[province] = {
+                **cells, **summary, "districts": districts, "event_count": int(self.count[a]),
+            }
+        return results
+
+
+def refresh_accumulators(publish: bool = False, hours: float = WINDOW_HOURS,
+                         resync: bool = False, k: int = TOP_K):
+    if not EVENTS_PATH.exists():
+        print("events.json not found!")
+        return
+
+    acc = ScoreAccumulators.load(window_hours=hours, k=k)
+    counts = acc.refresh(EventTable.load(EVENTS_PATH))
+    if resync:
+        acc.resync()
+    acc.save()
+
+    if publish:
+        publish_outputs({
+            INDUSTRY_PATH: acc.industry_scores(),
+            DISTRICT_PATH: acc.district_scores(),
+            PROVINCE_PATH: acc.province_scores(),
+        })
+
+    print(
+        f"[accumulators] +{counts['added']} new, ~{counts['rescored']} changed, "
+        f"{counts['relevelled']} re-levelled, -{counts['removed']} removed, "
+        f"{len(acc.events)} in window"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally update windowed score sums")
+    parser.add_argument("--hours", type=float, default=WINDOW_HOURS)
+    parser.add_argument("--publish", action="store_true",
+                        help="write industry/district/province score files from the accumulators")
+    parser.add_argument("--resync", action="store_true",
+                        help="rebuild the sums from the stored contributions (clears float drift)")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="drivers kept per cell")
+    args = parser.parse_args()
+    refresh_accumulators(args.publish, args.hours, args.resync, args.top_k)
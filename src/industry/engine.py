@@ -0,0 +1,186 @@
+# src/industry/engine.py
+"""
+Fused scoring engine.
+
+Replaces the score → score_district → aggregate chain (three JSON loads,
+three event scans and an in-place rewrite of district_scores.json) with
+one pass over the event table. The severity × sensitivity product is
+computed once per event and reused for every level:
+
+- national:  industry_scores.json   (same values as industry.score)
+- district:  district_scores.json   (district × industry cells plus the
+                                     aggregate fields of district.aggregate)
+- province:  province_scores.json   (province × industry cells over the
+                                     districts in footprint.PROVINCE_MAP)
+
+All files are written to temp names first and only renamed into place
+once every output is ready, so readers never see a mix of runs.
+
+    python -m src.industry.engine
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.events.table import EventTable
+from .footprint import INDUSTRY_REGIONS, PROVINCE_MAP
+from .matrix import (
+    DISTRICT_CORE_FACTOR, DISTRICT_OTHER_FACTOR, district_location_rows, driver_refs,
+    event_location_factors, event_severity, exposure_vector, sensitivity_rows, split_risk_opp,
+    top_driver_rows,
+)
+from .score import HIGH, MEDIUM
+from .score_district import ALL_DISTRICTS
+from .sensitivity import INDUSTRIES
+
+EVENTS_PATH = Path("data/processed/events.json")
+INDUSTRY_PATH = Path("data/processed/industry_scores.json")
+DISTRICT_PATH = Path("data/processed/district_scores.json")
+PROVINCE_PATH = Path("data/processed/province_scores.json")
+
+TOP_K = 3   # drivers kept per cell
+
+
+def level(score) -> str:
+    return "High" if score >= HIGH else "Medium" if score >= MEDIUM else "Low"
+
+
+# ------------------------------
+# Cells
+# ------------------------------
+def _cells(table: EventTable, rows: np.ndarray, impact: np.ndarray,
+           risk_cap: float, opp_cap: float, k: int) -> Dict[str, Dict]:
+    """Per-industry score dicts for the events `rows` with the given impacts."""
+    risk_raws, opp_raws = split_risk_opp(impact)
+    has_opp = (impact > 0).any(axis=0)
+    has_risk = (impact <= 0).any(axis=0)
+    top_rows = top_driver_rows(impact, k)
+
+    cells = {}
+    for j, industry in enumerate(INDUSTRIES):
+        # accumulators stay a plain 0 until something is added to them
+        risk = min(float(risk_raws[j]) if has_risk[j] else 0, risk_cap)
+        opp = min(float(opp_raws[j]) if has_opp[j] else 0, opp_cap)
+        top = rows[top_rows[:, j]]
+        cells[industry] = {
+            "risk_score": round(risk, 2),
+            "opp_score": round(opp, 2),
+            "risk_level": level(risk),
+            "opp_level": level(opp),
+            "top_drivers": [table.title[r] for r in top],
+            "top_driver_events": driver_refs(table.ids, top, impact[top_rows[:, j], j]),
+        }
+    return cells
+
+
+def summarize_cells(cells: Dict[str, Dict]) -> Dict:
+    """Average of the rounded industry scores (district.aggregate fields)."""
+    risks = [c["risk_score"] for c in cells.values()]
+    opps = [c["opp_score"] for c in cells.values()]
+    avg_risk = round(sum(risks) / len(risks), 2) if risks else 0
+    avg_opp = round(sum(opps) / len(opps), 2) if opps else 0
+    return {
+        "risk_score": avg_risk,
+        "opp_score": avg_opp,
+        "risk_level": level(avg_risk),
+        "opp_level": level(avg_opp),
+        "event_count": len(risks),
+    }
+
+
+def province_location_rows() -> np.ndarray:
+    """provinces × industries factor, same rule as the district factor."""
+    loc = np.full((len(PROVINCE_MAP), len(INDUSTRIES)), DISTRICT_OTHER_FACTOR)
+    for r, province in enumerate(PROVINCE_MAP):
+        for j, industry in enumerate(INDUSTRIES):
+            if province in INDUSTRY_REGIONS.get(industry, []):
+                loc[r, j] = DISTRICT_CORE_FACTOR
+    return loc
+
+
+# ------------------------------
+# Engine
+# ------------------------------
+def score_all(table: EventTable, k: int = TOP_K) -> Tuple[Dict, Dict, Dict]:
+    """(industry, district, province) results from one pass over the table."""
+    sens_rows, scored_rows = sensitivity_rows(table.types.names)
+    scored = scored_rows[table.type_code]
+
+    # severity · sensitivity, shared by every level
+    base = event_severity(table)[:, None] * sens_rows[table.type_code]
+
+    # national: (sev · sens · loc) / 2 · exposure over all scored events
+    national_rows = np.flatnonzero(scored)
+    national_impact = (base * event_location_factors(table))[national_rows] / 2
+    national_impact *= exposure_vector()
+    industry_results = _cells(table, national_rows, national_impact, 0.8, 0.85, k)
+
+    # district postings, restricted to scored events
+    offsets, postings = table.district_postings()
+    postings_of: Dict[str, np.ndarray] = {}
+    for name in ALL_DISTRICTS:
+        code = table.districts.codes[name]
+        evs = postings[offsets[code]:offsets[code + 1]]
+        postings_of[name] = evs[scored[evs]]
+
+    # district × industry, plus the district-level aggregate
+    district_results = {}
+    district_loc = district_location_rows(ALL_DISTRICTS)
+    for d, name in enumerate(ALL_DISTRICTS):
+        rows = postings_of[name]
+        cells = _cells(table, rows, base[rows] * district_loc[d], 1.0, 1.0, k)
+        district_results[name] = {**cells, **summarize_cells(cells)}
+
+    # province × industry: each event once per province it touches
+    province_results = {}
+    province_loc = province_location_rows()
+    for p, (province, districts) in enumerate(PROVINCE_MAP.items()):
+        parts: List[np.ndarray] = [postings_of[d] for d in districts if d in postings_of]
+        rows = np.unique(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+        cells = _cells(table, rows, base[rows] * province_loc[p], 1.0, 1.0, k)
+        summary = summarize_cells(cells)
+        summary.pop("event_count")
+        province_results[province] = {
+            **cells, **summary, "districts": districts, "event_count": int(len(rows)),
+        }
+
+    return industry_results, district_results, province_results
+
+
+def publish_outputs(outputs: Dict[Path, Dict]):
+    """Write every output to a temp file, then rename them all into place."""
+    tmps = []
+    for path, obj in outputs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+        tmps.append((tmp, path))
+    for tmp, path in tmps:
+        os.replace(tmp, path)
+
+
+def run_engine(k: int = TOP_K):
+    if not EVENTS_PATH.exists():
+        print("events.json not found!")
+        return
+
+    industries, districts, provinces = score_all(EventTable.load(EVENTS_PATH), k)
+    publish_outputs({
+        INDUSTRY_PATH: industries,
+        DISTRICT_PATH: districts,
+        PROVINCE_PATH: provinces,
+    })
+
+    print("Scoring complete →", INDUSTRY_PATH, DISTRICT_PATH, PROVINCE_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fused national / province / district scoring")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="drivers kept per cell")
+    run_engine(parser.parse_args().top_k)
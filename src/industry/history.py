@@ -0,0 +1,182 @@
+# src/industry/history.py
+"""
+Append-only history of published scores.
+
+Every run's industry, province and district scores are appended as
+fixed-size packed records to one binary file:
+
+    run_ts  int64    epoch seconds of the run
+    area    uint16   code of the district / province / NATIONAL
+    industry uint8   code of the industry
+    risk    float32
+    opp     float32
+
+One run over 25 districts, 9 provinces and the national level is 350
+records (~6.5 KB). Appending writes those bytes to the end of the file,
+and nothing earlier is rewritten. Area and industry names are kept as
+Categories in a small JSON sidecar, so codes stay stable when the lists
+change.
+
+Runs are appended in time order, so run_ts is sorted. A range query
+memory-maps the file, binary-searches the two time bounds and filters
+only the records in between:
+
+    python -m src.industry.history --append
+    python -m src.industry.history --area Colombo --industry Logistics --days 30
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.events.store import write_json_atomic
+from src.events.table import Categories
+from src.utils.region import NATIONAL
+from src.utils.timeparse import epoch_to_iso, now_epoch
+
+HISTORY_PATH = Path("data/history/score_history.bin")
+INDUSTRY_PATH = Path("data/processed/industry_scores.json")
+DISTRICT_PATH = Path("data/processed/district_scores.json")
+PROVINCE_PATH = Path("data/processed/province_scores.json")
+
+RECORD = np.dtype([
+    ("run_ts", "<i8"),
+    ("area", "<u2"),
+    ("industry", "u1"),
+    ("risk", "<f4"),
+    ("opp", "<f4"),
+])   # packed: 19 bytes per record
+
+
+class ScoreHistory:
+
+    def __init__(self, path: Path = HISTORY_PATH):
+        self.path = path
+        self.names_path = path.with_suffix(".json")
+        self.areas = Categories()
+        self.industries = Categories()
+        if self.names_path.exists():
+            with open(self.names_path, "r", encoding="utf-8") as f:
+                names = json.load(f)
+            self.areas = Categories(names["areas"])
+            self.industries = Categories(names["industries"])
+
+    # --------------------------
+    # Reading
+    # --------------------------
+    def records(self) -> np.ndarray:
+        """All records, memory-mapped (empty array when nothing is stored)."""
+        if not self.path.exists() or self.path.stat().st_size < RECORD.itemsize:
+            return np.zeros(0, dtype=RECORD)
+        n = self.path.stat().st_size // RECORD.itemsize     # ignore a torn final record
+        return np.memmap(self.path, dtype=RECORD, mode="r", shape=(n,))
+
+    def last_run(self) -> Optional[int]:
+        recs = self.records()
+        return int(recs["run_ts"][-1]) if len(recs) else None
+
+    def series(self, area: str, industry: str, since: int = 0,
+               until: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(run_ts, risk, opp) of one area × industry for since <= run_ts <= until."""
+        empty = np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)
+        a, i = self.areas.codes.get(area), self.industries.codes.get(industry)
+        if a is None or i is None:
+            return empty
+
+        recs = self.records()
+        ts = recs["run_ts"]
+        lo = int(np.searchsorted(ts, since, side="left"))
+        hi = len(ts) if until is None else int(np.searchsorted(ts, until, side="right"))
+        window = recs[lo:hi]
+
+        hit = (window["area"] == a) & (window["industry"] == i)
+        rows = window[hit]
+        return (
+            rows["run_ts"].astype(np.int64),
+            np.round(rows["risk"].astype(np.float64), 2),     # scores are 2-decimal
+            np.round(rows["opp"].astype(np.float64), 2),
+        )
+
+    # --------------------------
+    # Appending
+    # --------------------------
+    def append(self, run_ts: int, scores: Dict[str, Dict[str, Dict]]) -> int:
+        """Append one run: {area: {industry: {"risk_score", "opp_score"}}}.
+
+        Returns the number of records written. Runs must arrive in time
+        order, since range queries binary-search run_ts.
+        """
+        last = self.last_run()
+        if last is not None and run_ts < last:
+            raise ValueError(f"run_ts {run_ts} is older than the last stored run {last}")
+
+        rows = []
+        for area, cells in scores.items():
+            for industry, cell in cells.items():
+                if not isinstance(cell, dict) or "risk_score" not in cell:
+                    continue      # district aggregate fields
+                rows.append((run_ts, self.areas.code(area), self.industries.code(industry),
+                             cell["risk_score"], cell["opp_score"]))
+        if not rows:
+            return 0
+
+        # names first: a record must never reference a code the sidecar lacks
+        write_json_atomic(self.names_path, {
+            "areas": self.areas.names,
+            "industries": self.industries.names,
+        })
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            size = self.path.stat().st_size
+            if size % RECORD.itemsize:
+                os.truncate(self.path, size - size % RECORD.itemsize)   # drop a torn record
+        with open(self.path, "ab") as f:
+            f.write(np.array(rows, dtype=RECORD).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        return len(rows)
+
+
+def _load_scores(path: Path) -> Dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def append_run(run_ts: Optional[int] = None, path: Path = HISTORY_PATH) -> int:
+    """Append the published industry / province / district scores as one run."""
+    run_ts = now_epoch() if run_ts is None else run_ts
+    scores = {}
+    industries = _load_scores(INDUSTRY_PATH)
+    if industries:
+        scores[NATIONAL] = industries
+    scores.update(_load_scores(PROVINCE_PATH))
+    scores.update(_load_scores(DISTRICT_PATH))
+    return ScoreHistory(path).append(run_ts, scores)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score history snapshots")
+    parser.add_argument("--append", action="store_true",
+                        help="append the current published scores as a run")
+    parser.add_argument("--area", help=f"district, province or {NATIONAL}")
+    parser.add_argument("--industry")
+    parser.add_argument("--days", type=float, default=30, help="look-back window")
+    args = parser.parse_args()
+
+    if args.append:
+        n = append_run()
+        print(f"Appended {n} score records →", HISTORY_PATH)
+    elif args.area and args.industry:
+        since = now_epoch() - int(args.days * 86400)
+        ts, risk, opp = ScoreHistory().series(args.area, args.industry, since)
+        print(f"{args.area} / {args.industry}: {len(ts)} runs over {args.days:g} days")
+        for t, r, o in zip(ts, risk, opp):
+            print(f"  {epoch_to_iso(int(t))}  risk {r:.2f}  opp {o:.2f}")
+    else:
+        parser.error("use --append, or --area with --industry")
@@ -0,0 +1,355 @@
+# src/industry/live.py
+"""
+Read-time industry / province / district scores with recency decay.
+
+The pipeline stores each event's static severity (every term except
+recency) plus its timestamp. Recency only takes five values, so the
+severity of an event at each recency level is known up front; what
+changes with the clock is which level each event is in.
+
+This module caches, per recency level, hourly partial sums of severity
+for every scoring "atom":
+
+- district scores: (event type, district)
+- province scores: (event type, province), an event once per province
+- industry scores: (event type, location profile), where the profile is
+  the event's location_factor for each industry
+
+At read time the level boundaries (now-1h, now-6h, now-24h, now-72h) are
+located by binary search; whole hours come from the cached prefix sums
+and only the events in the hour a boundary falls into are summed
+directly. Scores are then a small matrix product with the sensitivity
+matrix, so a dashboard opened hours after a run shows current values
+without rerunning the pipeline.
+
+Severities per level are exact, but the sums are grouped by atom and
+hour instead of added event by event, so at the pipeline's own timestamp
+the scores agree with the engine's files only to float rounding: a raw
+sum sitting on a rounding edge can come out one cent apart.
+
+    python -m src.industry.live            # build the cache from events.json
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.events.severity import RECENCY_FLOOR, RECENCY_STEPS, severity_at, static_severity_table
+from src.events.table import EventTable
+from src.utils.timeparse import now_epoch
+from .engine import province_location_rows, summarize_cells
+from .footprint import PROVINCE_MAP
+from .matrix import district_location_rows, exposure_vector, sensitivity_rows
+from .score import HIGH, MEDIUM, location_factor as industry_location
+from .score_district import ALL_DISTRICTS
+from .sensitivity import INDUSTRIES, SENSITIVITY_MATRIX
+
+EVENTS_PATH = Path("data/processed/events.json")
+CACHE_PATH = Path("data/cache/score_partials.npz")
+
+SLOT_SECONDS = 3600
+
+# recency weight per level, freshest first
+LEVELS = np.array([w for _, w in RECENCY_STEPS] + [RECENCY_FLOOR])
+CUT_SECONDS = np.array([h * 3600 for h, _ in RECENCY_STEPS], dtype=np.int64)
+
+# events without a timestamp always count as fresh (recency_weight(None) == 1.0)
+_NO_TS = np.iinfo(np.int64).max
+
+SCORED_TYPES = list(SENSITIVITY_MATRIX)
+
+
+def _level(score: float) -> str:
+    return "High" if score >= HIGH else "Medium" if score >= MEDIUM else "Low"
+
+
+# ------------------------------
+# One stream of (ts, atom, severity-per-level) entries
+# ------------------------------
+class _Stream:
+    """Entries sorted by ts, with hourly prefix sums per recency level."""
+
+    def __init__(self, ts: np.ndarray, atom: np.ndarray, sev: np.ndarray, n_atoms: int):
+        order = np.argsort(ts, kind="stable")
+        self.ts = ts[order]
+        self.atom = atom[order]
+        self.sev = sev[order]                  # entries × levels
+        self.n_atoms = n_atoms
+
+        slots = self.ts // SLOT_SECONDS
+        starts = np.flatnonzero(np.diff(slots)) + 1
+        self.bounds = np.concatenate(([0], starts, [len(self.ts)])).astype(np.int64)
+
+        # prefix[k, j] = per-atom sums of level-k severity for entries before bounds[j]
+        slot_id = np.repeat(np.arange(len(self.bounds) - 1), np.diff(self.bounds))
+        flat = slot_id * n_atoms + self.atom
+        size = (len(self.bounds) - 1) * n_atoms
+        self.prefix = np.zeros((len(LEVELS), len(self.bounds), n_atoms))
+        for k in range(len(LEVELS)):
+            sums = np.bincount(flat, weights=self.sev[:, k], minlength=size)
+            np.cumsum(sums.reshape(-1, n_atoms), axis=0, out=self.prefix[k, 1:])
+
+    def _direct(self, k: int, lo: int, hi: int) -> np.ndarray:
+        return np.bincount(self.atom[lo:hi], weights=self.sev[lo:hi, k], minlength=self.n_atoms)
+
+    def range_sum(self, k: int, lo: int, hi: int) -> np.ndarray:
+        """Per-atom sum of level-k severity over sorted entries [lo, hi)."""
+        if lo >= hi:
+            return np.zeros(self.n_atoms)
+        first = int(np.searchsorted(self.bounds, lo, side="left"))     # first slot start >= lo
+        last = int(np.searchsorted(self.bounds, hi, side="right")) - 1  # last slot start <= hi
+        if first > last:
+            return self._direct(k, lo, hi)
+        return (
+            self.prefix[k, last] - self.prefix[k, first]
+            + self._direct(k, lo, int(self.bounds[first]))
+            + self._direct(k, int(self.bounds[last]), hi)
+        )
+
+    def totals_at(self, now: int) -> np.ndarray:
+        """Per-atom severity sums with every entry at its recency level for `now`."""
+        # idx[j]: entries with ts <= now - CUT_SECONDS[j] are past boundary j
+        idx = np.searchsorted(self.ts, now - CUT_SECONDS, side="right")
+        edges = [len(self.ts)] + [int(i) for i in idx] + [0]
+        total = np.zeros(self.n_atoms)
+        for k in range(len(LEVELS)):
+            total += self.range_sum(k, edges[k + 1], edges[k])
+        return total
+
+    def arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {
+            f"{prefix}_ts": self.ts,
+            f"{prefix}_atom": self.atom,
+            f"{prefix}_sev": self.sev,
+            f"{prefix}_bounds": self.bounds,
+            f"{prefix}_prefix": self.prefix,
+        }
+
+    @classmethod
+    def from_arrays(cls, data, prefix: str, n_atoms: int) -> "_Stream":
+        s = cls.__new__(cls)
+        s.ts = data[f"{prefix}_ts"]
+        s.atom = data[f"{prefix}_atom"]
+        s.sev = data[f"{prefix}_sev"]
+        s.bounds = data[f"{prefix}_bounds"]
+        s.prefix = data[f"{prefix}_prefix"]
+        s.n_atoms = n_atoms
+        return s
+
+
+# ------------------------------
+# Partial sums for all scores
+# ------------------------------
+class ScorePartials:
+
+    def __init__(self, districts: _Stream, provinces: _Stream, industries: _Stream,
+                 profiles: np.ndarray):
+        self.districts = districts
+        self.provinces = provinces
+        self.industries = industries
+        self.profiles = profiles                      # profiles × industries location factors
+
+        # types × industries, split by sign so risk and opportunity stay separate
+        sens = sensitivity_rows(SCORED_TYPES)[0][:-1]
+        self.sens_opp = np.where(sens > 0, sens, 0.0)
+        self.sens_risk = np.where(sens < 0, -sens, 0.0)
+
+        self.district_loc = district_location_rows(ALL_DISTRICTS)
+        self.province_loc = province_location_rows()
+        self.exposure = exposure_vector()
+
+    # --------------------------
+    # Building
+    # --------------------------
+    @classmethod
+    def build(cls, table: EventTable) -> "ScorePartials":
+        static = table.severity_static
+        if np.isnan(static).any():
+            static = static_severity_table(table)
+        sev = severity_at(static[:, None], LEVELS[None, :])      # events × levels
+
+        ts = np.where(table.ts == 0, _NO_TS, table.ts)
+
+        type_row = np.array(
+            [SCORED_TYPES.index(n) if n in SENSITIVITY_MATRIX else -1 for n in table.types.names]
+            + [-1],                                              # type_code -1
+            dtype=np.int64,
+        )[table.type_code]
+
+        # district stream: one entry per (event, scored district)
+        n_d = len(ALL_DISTRICTS)
+        district_row = np.array(
+            [ALL_DISTRICTS.index(n) if n in ALL_DISTRICTS else -1 for n in table.districts.names],
+            dtype=np.int64,
+        )
+        ev = table.district_event_index()
+        d = district_row[table.district_codes] if len(ev) else np.zeros(0, dtype=np.int64)
+        keep = (type_row[ev] >= 0) & (d >= 0)
+        pairs = np.unique(ev[keep] * n_d + d[keep])          # a district counts once per event
+        ev, d = pairs // n_d, pairs % n_d
+        districts = _Stream(ts[ev], type_row[ev] * n_d + d, sev[ev], len(SCORED_TYPES) * n_d)
+
+        # province stream: one entry per (event, province) it has a scored district in
+        n_p = len(PROVINCE_MAP)
+        province_of = np.array(
+            [next(p for p, ds in enumerate(PROVINCE_MAP.values()) if name in ds)
+             for name in ALL_DISTRICTS],
+            dtype=np.int64,
+        )
+        pairs = np.unique(ev * n_p + province_of[d])
+        pev, pr = pairs // n_p, pairs % n_p
+        provinces = _Stream(ts[pev], type_row[pev] * n_p + pr, sev[pev], len(SCORED_TYPES) * n_p)
+
+        # industry stream: one entry per scored event, keyed by location profile
+        profile_ids: Dict[tuple, int] = {}
+        profiles = []
+        by_districts: Dict[tuple, int] = {}
+        profile = np.empty(len(table), dtype=np.int64)
+        for i in range(len(table)):
+            key = tuple(table.district_codes_of(i))
+            p = by_districts.get(key)
+            if p is None:
+                names = [table.districts.names[c] for c in key]
+                vec = tuple(industry_location(ind, names) for ind in INDUSTRIES)
+                p = profile_ids.setdefault(vec, len(profiles))
+                if p == len(profiles):
+                    profiles.append(vec)
+                by_districts[key] = p
+            profile[i] = p
+
+        scored = np.flatnonzero(type_row >= 0)
+        n_prof = max(len(profiles), 1)
+        industries = _Stream(
+            ts[scored], type_row[scored] * n_prof + profile[scored], sev[scored],
+            len(SCORED_TYPES) * n_prof,
+        )
+
+        profiles = np.array(profiles, dtype=np.float64).reshape(-1, len(INDUSTRIES))
+        return cls(districts, provinces, industries, profiles)
+
+    def save(self, path: Path = CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, profiles=self.profiles,
+                 **self.districts.arrays("d"), **self.provinces.arrays("p"),
+                 **self.industries.arrays("i"))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = CACHE_PATH) -> Optional["ScorePartials"]:
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            data = dict(data)
+        if "p_ts" not in data:          # cache from before province scores; rebuild it
+            return None
+        profiles = data["profiles"]
+        n_t = len(SCORED_TYPES)
+        return cls(
+            _Stream.from_arrays(data, "d", n_t * len(ALL_DISTRICTS)),
+            _Stream.from_arrays(data, "p", n_t * len(PROVINCE_MAP)),
+            _Stream.from_arrays(data, "i", n_t * max(len(profiles), 1)),
+            profiles,
+        )
+
+    # --------------------------
+    # Read-time scores
+    # --------------------------
+    def industry_scores(self, now: int = None) -> Dict:
+        now = now_epoch() if now is None else now
+        n_p = max(len(self.profiles), 1)
+        sums = self.industries.totals_at(now).reshape(len(SCORED_TYPES), n_p)
+
+        # Σ_t Σ_p sev · loc[p, i] · |sens[t, i]| / 2 · exposure[i]
+        weighted = sums @ self.profiles if len(self.profiles) else np.zeros_like(self.sens_opp)
+        opp_raw = (weighted * self.sens_opp).sum(axis=0) / 2 * self.exposure
+        risk_raw = (weighted * self.sens_risk).sum(axis=0) / 2 * self.exposure
+
+        results = {}
+        for j, industry in enumerate(INDUSTRIES):
+            risk = min(risk_raw[j], 0.8)
+            opp = min(opp_raw[j], 0.85)
+            results[industry] = {
+                "risk_score": round(float(risk), 2),
+                "opp_score": round(float(opp), 2),
+                "risk_level": _level(risk),
+                "opp_level": _level(opp),
+            }
+        return results
+
+    def district_scores(self, now: int = None) -> Dict:
+        """district_scores.json layout, including the aggregate fields."""
+        now = now_epoch() if now is None else now
+        n_d = len(ALL_DISTRICTS)
+        sums = self.districts.totals_at(now).reshape(len(SCORED_TYPES), n_d)
+
+        # districts × industries
+        risk_raw = (sums.T @ self.sens_risk) * self.district_loc
+        opp_raw = (sums.T @ self.sens_opp) * self.district_loc
+
+        results = {}
+        for di, district in enumerate(ALL_DISTRICTS):
+            block = {}
+            for j, industry in enumerate(INDUSTRIES):
+                risk = min(risk_raw[di, j], 1.0)
+                opp = min(opp_raw[di, j], 1.0)
+                block[industry] = {
+                    "risk_score": round(float(risk), 2),
+                    "opp_score": round(float(opp), 2),
+                    "risk_level": _level(risk),
+                    "opp_level": _level(opp),
+                }
+            risks = [v["risk_score"] for v in block.values()]
+            opps = [v["opp_score"] for v in block.values()]
+            block["risk_score"] = round(sum(risks) / len(risks), 2)
+            block["opp_score"] = round(sum(opps) / len(opps), 2)
+            block["risk_level"] = _level(block["risk_score"])
+            block["opp_level"] = _level(block["opp_score"])
+            block["event_count"] = len(risks)
+            results[district] = block
+        return results
+
+    def province_scores(self, now: int = None) -> Dict:
+        """province_scores.json layout; event_count counts every cached event."""
+        now = now_epoch() if now is None else now
+        n_p = len(PROVINCE_MAP)
+        sums = self.provinces.totals_at(now).reshape(len(SCORED_TYPES), n_p)
+
+        # provinces × industries
+        risk_raw = (sums.T @ self.sens_risk) * self.province_loc
+        opp_raw = (sums.T @ self.sens_opp) * self.province_loc
+        counts = np.bincount(self.provinces.atom % n_p, minlength=n_p)
+
+        results = {}
+        for p, (province, districts) in enumerate(PROVINCE_MAP.items()):
+            cells = {}
+            for j, industry in enumerate(INDUSTRIES):
+                risk = min(risk_raw[p, j], 1.0)
+                opp = min(opp_raw[p, j], 1.0)
+                cells[industry] = {
+                    "risk_score": round(float(risk), 2),
+                    "opp_score": round(float(opp), 2),
+                    "risk_level": _level(risk),
+                    "opp_level": _level(opp),
+                }
+            summary = summarize_cells(cells)
+            summary.pop("event_count")
+            results[province] = {
+                **cells, **summary, "districts": districts, "event_count": int(counts[p]),
+            }
+        return results
+
+
+def build_partials():
+    if not EVENTS_PATH.exists():
+        print("events.json not found!")
+        return
+
+    partials = ScorePartials.build(EventTable.load(EVENTS_PATH))
+    partials.save()
+    print("Read-time score partials saved →", CACHE_PATH)
+
+
+if __name__ == "__main__":
+    build_partials()
@@ -0,0 +1,185 @@
+# src/industry/matrix.py
+"""
+Dense array forms of the scoring tables.
+
+- sensitivity: event types × industries (SENSITIVITY_MATRIX), with a
+  trailing zero row so EventTable.type_code == -1 indexes it directly
+- location: districts × industries, per district name in a Categories
+- exposure: per-industry multiplier vector (INDUSTRY_EXPOSURE)
+
+Gathering rows of these by categorical code turns the per-(event,
+industry) Python loops of the scoring stages into a handful of array ops.
+Element-wise products keep the same operand order as the original loops
+so every impact is bit-identical.
+"""
+
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from src.events.table import EventTable
+from src.utils.region import NATIONAL
+from .footprint import INDUSTRY_REGIONS, district_to_province
+from .sensitivity import INDUSTRIES, INDUSTRY_EXPOSURE, SENSITIVITY_MATRIX
+
+# location_factor values in score.py
+NATIONAL_FACTOR = 0.6
+CORE_FACTOR = 1.0
+OTHER_PROVINCE_FACTOR = 0.3
+FLOOR_FACTOR = 0.1
+
+# location_factor values in score_district.py
+DISTRICT_CORE_FACTOR = 1.0
+DISTRICT_OTHER_FACTOR = 0.4
+
+
+def sensitivity_rows(type_names: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """(types+1) × industries sensitivities and a "scored" mask per row.
+
+    Types missing from SENSITIVITY_MATRIX (and the trailing row for
+    unclassified events) get zeros and scored == False.
+    """
+    names = list(type_names)
+    sens = np.zeros((len(names) + 1, len(INDUSTRIES)))
+    scored = np.zeros(len(names) + 1, dtype=bool)
+    for r, name in enumerate(names):
+        row = SENSITIVITY_MATRIX.get(name)
+        if row is not None:
+            sens[r] = [row[i] for i in INDUSTRIES]
+            scored[r] = True
+    return sens, scored
+
+
+def exposure_vector() -> np.ndarray:
+    return np.array([INDUSTRY_EXPOSURE.get(i, 1.0) for i in INDUSTRIES])
+
+
+def industry_location_rows(district_names: Iterable[str]) -> np.ndarray:
+    """districts × industries factor of a single district (score.location_factor)."""
+    names = list(district_names)
+    loc = np.full((len(names), len(INDUSTRIES)), FLOOR_FACTOR)
+    for r, name in enumerate(names):
+        province = district_to_province(name)
+        if not province:
+            continue
+        for j, industry in enumerate(INDUSTRIES):
+            core = province in INDUSTRY_REGIONS.get(industry, [])
+            loc[r, j] = CORE_FACTOR if core else OTHER_PROVINCE_FACTOR
+    return loc
+
+
+def district_location_rows(district_names: Iterable[str]) -> np.ndarray:
+    """districts × industries factor used by score_district.location_factor."""
+    names = list(district_names)
+    loc = np.full((len(names), len(INDUSTRIES)), DISTRICT_OTHER_FACTOR)
+    for r, name in enumerate(names):
+        province = district_to_province(name)
+        for j, industry in enumerate(INDUSTRIES):
+            if province in INDUSTRY_REGIONS.get(industry, []):
+                loc[r, j] = DISTRICT_CORE_FACTOR
+    return loc
+
+
+def event_location_factors(table: EventTable) -> np.ndarray:
+    """events × industries score.location_factor, from the CSR district columns."""
+    n = len(table)
+    counts = table.district_counts()
+    loc = np.full((n, len(INDUSTRIES)), NATIONAL_FACTOR)
+
+    # exactly ["NATIONAL"] counts as national, like an empty list
+    has = counts > 0
+    first = np.full(n, -1, dtype=np.int64)
+    first[has] = table.district_codes[table.district_offsets[:-1][has]]
+    only_national = (counts == 1) & (first == table.districts.codes.get(NATIONAL, -2))
+
+    regional = np.flatnonzero((counts > 0) & ~only_national)
+    if len(regional):
+        rows = industry_location_rows(table.districts.names)[table.district_codes]
+        # max over each event's districts; non-empty CSR segments start at offsets
+        maxima = np.maximum.reduceat(rows, table.district_offsets[regional], axis=0)
+        loc[regional] = maxima
+    return loc
+
+
+def district_membership(table: EventTable, district_names: Iterable[str]) -> np.ndarray:
+    """events × districts 0/1 matrix; an event counts once per district it names."""
+    names = list(district_names)
+    membership = np.zeros((len(table), len(names)))
+    offsets, postings = table.district_postings()
+    for d, name in enumerate(names):
+        code = table.districts.codes.get(name)
+        if code is not None:
+            membership[postings[offsets[code]:offsets[code + 1]], d] = 1.0
+    return membership
+
+
+def event_severity(table: EventTable) -> np.ndarray:
+    """Severity column with unscored events at 0 (ev.get("severity", 0))."""
+    return np.nan_to_num(table.severity, nan=0.0)
+
+
+def event_impacts(table: EventTable) -> Tuple[np.ndarray, np.ndarray]:
+    """events × industries impact of score.py, and the mask of scored events.
+
+    impact = (severity · sensitivity · location) / 2 · exposure
+    """
+    sens_rows, scored_rows = sensitivity_rows(table.types.names)
+    sens = sens_rows[table.type_code]
+    scored = scored_rows[table.type_code]
+
+    sev = event_severity(table)[:, None]
+    impact = (sev * sens * event_location_factors(table)) / 2
+    impact *= exposure_vector()
+    return impact, scored
+
+
+def sequential_sums(values: np.ndarray) -> np.ndarray:
+    """Column sums accumulated in row order, like a Python `+=` loop.
+
+    np.sum uses pairwise summation, which can differ in the last bit; the
+    scores are rounded and clamped afterwards, so match the loop exactly.
+    """
+    if not len(values):
+        return np.zeros(values.shape[1:])
+    return np.cumsum(values, axis=0)[-1]
+
+
+def split_risk_opp(impact: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(risk_raw, opp_raw) column sums: positive impacts are opportunity."""
+    positive = impact > 0
+    opp = sequential_sums(np.where(positive, impact, 0.0))
+    risk = sequential_sums(np.where(positive, 0.0, np.abs(impact)))
+    return risk, opp
+
+
+def top_driver_rows(impact: np.ndarray, k: int = 3) -> np.ndarray:
+    """Row indices of the k largest |impact| per column, largest first.
+
+    Bounded selection: np.partition finds each column's k-th largest
+    magnitude in O(rows). The rows strictly above it (fewer than k) are
+    kept, and rows equal to it fill the remaining slots in row order, so
+    ties keep the earlier row like a stable sort. Only those k rows are
+    ordered, however many rows tie (e.g. a column of zero impacts).
+    Returns a (min(k, rows), columns) array.
+    """
+    n, cols = impact.shape
+    k = min(k, n)
+    if k == 0:
+        return np.zeros((0, cols), dtype=np.int64)
+
+    mag = np.abs(impact)
+    kth = -np.partition(-mag, k - 1, axis=0)[k - 1]
+
+    picks = np.empty((k, cols), dtype=np.int64)
+    for j in range(cols):
+        above = np.flatnonzero(mag[:, j] > kth[j])
+        tied = np.flatnonzero(mag[:, j] == kth[j])[:k - len(above)]
+        cand = np.concatenate((above, tied))
+        order = np.lexsort((cand, -mag[cand, j]))
+        picks[:, j] = cand[order]
+    return picks
+
+
+def driver_refs(ids, rows: np.ndarray, impacts: np.ndarray):
+    """[{"id", "impact"}] for drill-down from a score cell to its events."""
+    return [{"id": ids[r], "impact": round(float(v), 4)} for r, v in zip(rows, impacts)]
@@ -0,0 +1,265 @@
+# src/industry/scenario.py
+"""
+Monte Carlo what-if scenarios over the scoring model.
+
+A scenario is one sensitivity matrix (types × industries) plus one set of
+severity term weights (SEVERITY_TERM_WEIGHTS). Scenarios are stacked into
+a (scenarios × types × industries) tensor and a (scenarios × terms)
+matrix and evaluated together against event features cached once from
+events.json:
+
+    severity[s, e]      = round(min(terms[e] · weights[s], 0.85), 2)
+    G[s, t, i]          = Σ_{e of type t} severity[s, e] · location[e, i]
+    H[s, t, d]          = Σ_{e of type t in d} severity[s, e]
+    national[s, i]      = Σ_t G[s, t, i] · |sens[s, t, i]| / 2 · exposure[i]
+    district[s, d, i]   = loc[d, i] · Σ_t H[s, t, d] · |sens[s, t, i]|
+
+with risk / opportunity split on the sign of sens[s, t, i], then clamped
+as in the engine. The result is a distribution per industry and per
+district × industry instead of a single score.
+
+Severity is summed term by term in compute_severity's order and rounded
+with severity_at, so unperturbed event severities are bit-identical to
+severity.py. The per-type sums then run in matmul order rather than the
+engine's event order, so unperturbed scores match the engine only up to
+float rounding (a published 2-decimal value can differ at a half-cent).
+
+    python -m src.industry.scenario --n 2000 --sens-sigma 0.15 \\
+        --set "Flood:Logistics=-0.9" --weight recency=0.10
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.events.severity import SEVERITY_TERMS, SEVERITY_TERM_WEIGHTS, severity_at, severity_terms
+from src.events.store import write_json_atomic
+from src.events.table import EventTable
+from .matrix import (
+    district_location_rows, district_membership, event_location_factors, exposure_vector,
+    sensitivity_rows,
+)
+from .score_district import ALL_DISTRICTS
+from .sensitivity import INDUSTRIES, SENSITIVITY_MATRIX
+
+EVENTS_PATH = Path("data/processed/events.json")
+OUTPUT_PATH = Path("data/processed/scenario_summary.json")
+
+SCENARIO_TYPES = list(SENSITIVITY_MATRIX)
+BATCH = 256                       # scenarios evaluated per tensor batch
+PERCENTILES = (5, 50, 95)
+
+
+# ------------------------------
+# Scenario sampling
+# ------------------------------
+def base_sensitivity() -> np.ndarray:
+    """types × industries matrix of SENSITIVITY_MATRIX, rows in SCENARIO_TYPES order."""
+    return sensitivity_rows(SCENARIO_TYPES)[0][:-1]
+
+
+def sample_scenarios(n: int, sens_sigma: float = 0.1, weight_sigma: float = 0.1,
+                     seed: int = 0,
+                     sens_overrides: Optional[Dict[Tuple[str, str], float]] = None,
+                     weight_overrides: Optional[Dict[str, float]] = None,
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """(n × types × industries sensitivities, n × terms weights).
+
+    Noise is multiplicative log-normal, so signs and zeros of the base
+    model are kept. Overrides are applied to every scenario before noise.
+    """
+    rng = np.random.default_rng(seed)
+
+    sens = base_sensitivity()
+    for (etype, industry), value in (sens_overrides or {}).items():
+        sens[SCENARIO_TYPES.index(etype), INDUSTRIES.index(industry)] = value
+
+    weights = np.array(SEVERITY_TERM_WEIGHTS, dtype=np.float64)
+    for term, value in (weight_overrides or {}).items():
+        weights[SEVERITY_TERMS.index(term)] = value
+
+    sens_t = sens[None] * np.exp(rng.normal(0.0, sens_sigma, (n,) + sens.shape))
+    weights_t = weights[None] * np.exp(rng.normal(0.0, weight_sigma, (n, len(weights))))
+    return sens_t, weights_t
+
+
+# ------------------------------
+# Cached event features
+# ------------------------------
+class ScenarioEngine:
+
+    def __init__(self, table: EventTable, now: Optional[int] = None):
+        type_row = np.array(
+            [SCENARIO_TYPES.index(n) if n in SENSITIVITY_MATRIX else -1 for n in table.types.names]
+            + [-1],
+            dtype=np.int64,
+        )[table.type_code]
+        scored = np.flatnonzero(type_row >= 0)
+
+        self.terms = severity_terms(table, now)[scored]               # E × terms
+        location = event_location_factors(table)[scored]             # E × I
+
+        membership = district_membership(table, ALL_DISTRICTS)[scored]  # E × D
+
+        # per type: which cached rows, and their location / membership blocks
+        types = type_row[scored]
+        self.by_type: List[Tuple[int, np.ndarray, np.ndarray, np.ndarray]] = []
+        for t in np.unique(types):
+            rows = np.flatnonzero(types == t)
+            self.by_type.append((int(t), rows, location[rows], membership[rows]))
+
+        self.district_loc = district_location_rows(ALL_DISTRICTS)     # D × I
+        self.exposure = exposure_vector()
+        self.n_events = len(scored)
+
+    def _batch(self, sens: np.ndarray, weights: np.ndarray) -> Dict[str, np.ndarray]:
+        s = len(weights)
+        n_t, n_i, n_d = len(SCENARIO_TYPES), len(INDUSTRIES), len(ALL_DISTRICTS)
+
+        # E × S, static terms summed left to right like compute_severity
+        static = self.terms[:, :1] * weights[:, 0]
+        for k in range(1, len(SEVERITY_TERMS) - 1):
+            static = static + self.terms[:, k:k + 1] * weights[:, k]
+        severity = severity_at(static, self.terms[:, -1:], weights[:, -1])
+
+        G = np.zeros((s, n_t, n_i))
+        H = np.zeros((s, n_t, n_d))
+        for t, rows, location, membership in self.by_type:
+            sev_t = severity[rows].T                                   # S × E_t
+            G[:, t] = sev_t @ location
+            H[:, t] = sev_t @ membership
+
+        opp_sens = np.where(sens > 0, sens, 0.0)
+        risk_sens = np.where(sens < 0, -sens, 0.0)
+
+        return {
+            "national_risk": np.einsum("sti,sti->si", G, risk_sens) / 2 * self.exposure,
+            "national_opp": np.einsum("sti,sti->si", G, opp_sens) / 2 * self.exposure,
+            "district_risk": np.einsum("std,sti->sdi", H, risk_sens) * self.district_loc,
+            "district_opp": np.einsum("std,sti->sdi", H, opp_sens) * self.district_loc,
+        }
+
+    def evaluate(self, sens: np.ndarray, weights: np.ndarray,
+                 batch: int = BATCH) -> Dict[str, np.ndarray]:
+        """Clamped scores for every scenario.
+
+        national_*: scenarios × industries, district_*: scenarios × districts × industries.
+        """
+        if not len(weights):
+            n_i, n_d = len(INDUSTRIES), len(ALL_DISTRICTS)
+            return {
+                "national_risk": np.zeros((0, n_i)),
+                "national_opp": np.zeros((0, n_i)),
+                "district_risk": np.zeros((0, n_d, n_i)),
+                "district_opp": np.zeros((0, n_d, n_i)),
+            }
+
+        parts = [self._batch(sens[i:i + batch], weights[i:i + batch])
+                 for i in range(0, len(weights), batch)]
+        out = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+        out["national_risk"] = np.minimum(out["national_risk"], 0.8)
+        out["national_opp"] = np.minimum(out["national_opp"], 0.85)
+        out["district_risk"] = np.minimum(out["district_risk"], 1.0)
+        out["district_opp"] = np.minimum(out["district_opp"], 1.0)
+        return out
+
+
+# ------------------------------
+# Distributions
+# ------------------------------
+def _stats(samples: np.ndarray) -> Dict:
+    """Distribution summary of one score across scenarios."""
+    pct = np.percentile(samples, PERCENTILES)
+    return {
+        "mean": round(float(samples.mean()), 3),
+        "std": round(float(samples.std()), 3),
+        **{f"p{p}": round(float(v), 3) for p, v in zip(PERCENTILES, pct)},
+    }
+
+
+def summarize(scores: Dict[str, np.ndarray]) -> Dict:
+    industries = {
+        industry: {
+            "risk": _stats(scores["national_risk"][:, j]),
+            "opp": _stats(scores["national_opp"][:, j]),
+        }
+        for j, industry in enumerate(INDUSTRIES)
+    }
+    districts = {
+        district: {
+            industry: {
+                "risk": _stats(scores["district_risk"][:, d, j]),
+                "opp": _stats(scores["district_opp"][:, d, j]),
+            }
+            for j, industry in enumerate(INDUSTRIES)
+        }
+        for d, district in enumerate(ALL_DISTRICTS)
+    }
+    return {"industries": industries, "districts": districts}
+
+
+def _parse_sens_override(spec: str) -> Tuple[Tuple[str, str], float]:
+    # "Flood:Logistics=-0.9"
+    key, value = spec.split("=")
+    etype, industry = key.split(":")
+    if etype not in SENSITIVITY_MATRIX or industry not in INDUSTRIES:
+        raise ValueError(f"unknown event type / industry in {spec!r}")
+    return (etype, industry), float(value)
+
+
+def _parse_weight_override(spec: str) -> Tuple[str, float]:
+    # "recency=0.10"
+    term, value = spec.split("=")
+    if term not in SEVERITY_TERMS:
+        raise ValueError(f"unknown severity term {term!r}, expected one of {SEVERITY_TERMS}")
+    return term, float(value)
+
+
+def run_scenarios(n: int = 1000, sens_sigma: float = 0.1, weight_sigma: float = 0.1,
+                  seed: int = 0, sens_overrides=None, weight_overrides=None):
+    if not EVENTS_PATH.exists():
+        print("events.json not found!")
+        return
+
+    engine = ScenarioEngine(EventTable.load(EVENTS_PATH))
+    sens, weights = sample_scenarios(n, sens_sigma, weight_sigma, seed,
+                                     sens_overrides, weight_overrides)
+    summary = summarize(engine.evaluate(sens, weights))
+    summary["scenarios"] = {
+        "n": n,
+        "sens_sigma": sens_sigma,
+        "weight_sigma": weight_sigma,
+        "seed": seed,
+        "sens_overrides": {f"{t}:{i}": v for (t, i), v in (sens_overrides or {}).items()},
+        "weight_overrides": weight_overrides or {},
+        "events": engine.n_events,
+    }
+    write_json_atomic(OUTPUT_PATH, summary, indent=2)
+
+    print(f"{n} scenarios over {engine.n_events} events →", OUTPUT_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo what-if scoring scenarios")
+    parser.add_argument("--n", type=int, default=1000, help="number of scenarios")
+    parser.add_argument("--sens-sigma", type=float, default=0.1,
+                        help="log-normal noise on every sensitivity weight")
+    parser.add_argument("--weight-sigma", type=float, default=0.1,
+                        help="log-normal noise on the severity term weights")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="TYPE:INDUSTRY=VALUE",
+                        help="override one sensitivity, e.g. Flood:Logistics=-0.9")
+    parser.add_argument("--weight", action="append", default=[], metavar="TERM=VALUE",
+                        help=f"override a severity term weight ({', '.join(SEVERITY_TERMS)})")
+    args = parser.parse_args()
+    if args.n < 1:
+        parser.error("--n must be at least 1")
+
+    run_scenarios(
+        args.n, args.sens_sigma, args.weight_sigma, args.seed,
+        dict(_parse_sens_override(s) for s in args.set),
+        dict(_parse_weight_override(s) for s in args.weight),
+    )
@@ -1,9 +1,15 @@
 # src/industry/score.py
 
+import argparse
 import json
 from pathlib import Path
-from src.industry.sensitivity import SENSITIVITY_MATRIX, INDUSTRIES
+
+import numpy as np
+
+from src.events.table import EventTable
+from src.industry.sensitivity import INDUSTRIES
 from .footprint import INDUSTRY_REGIONS, district_to_province
+from .matrix import driver_refs, event_impacts, split_risk_opp, top_driver_rows
 
 EVENTS_PATH = Path("data/processed/events.json")
 OUTPUT_PATH = Path("data/processed/industry_scores.json")
@@ -11,6 +17,8 @@ OUTPUT_PATH = Path("data/processed/industry_scores.json")
 HIGH = 0.6
 MEDIUM = 0.3
 
+TOP_K = 3   # drivers kept per industry
+
 # ----------------------------------------------------
 # LOCATION FACTOR FUNCTION
 # ----------------------------------------------------
@@ -44,69 +52,33 @@ def location_factor(industry: str, event_districts: list):
 # ----------------------------------------------------
 # INDUSTRY SCORING ENGINE
 # ----------------------------------------------------
-def score_industries():
+# location_factor is kept for single lookups; the engine uses the
+# vectorized form in matrix.py (same values, all events at once).
+def score_industries(k: int = TOP_K):
     if not EVENTS_PATH.exists():
         print("events.json not found!")
         return
 
-    with open(EVENTS_PATH, "r", encoding="utf-8") as f:
-        events = json.load(f)
-
-    results = {}
-
-    for industry in INDUSTRIES:
-        risk_raw = 0
-        opp_raw = 0
-        drivers = []
-
-        for ev in events:
-            etype = ev.get("event_type")
-            sev = ev.get("severity", 0)
-            districts = ev.get("districts", ["NATIONAL"])
-
-            if etype not in SENSITIVITY_MATRIX:
-                continue
-
-            sens = SENSITIVITY_MATRIX[etype][industry]
-
-            loc_factor = location_factor(industry, districts)
+    table = EventTable.load(EVENTS_PATH)
 
-            impact = (sev * sens * loc_factor) / 2
-            # Industry exposure correction (Fix #5)
-            if industry == "IT":
-                impact *= 0.25      # IT is minimally affected by weather/disasters
-
-            if industry == "Banking":
-                impact *= 0.5      # Banking moderately affected by economic/political events
-
-            if industry == "Energy":
-                impact *= 0.7      # Energy affected by storms, outages, but not extreme
-
-            if industry == "Tourism":
-                impact *= 0.8      # Tourism is sensitive, but not as severely as Apparel/Logistics
-
-            if industry == "Agriculture":
-                impact *= 1.2      # Agriculture is HIGHLY sensitive to weather conditions
-
-            if industry == "Water":
-                impact *= 1.2      # Water industry benefits strongly from weather events
-
-            if industry == "Logistics":
-                impact *= 1.0      # Logistics heavily affected by roads/weather
-
-            if industry == "Apparel":
-                impact *= 1.0      # Apparel very dependent on transport and weather
-
-            if industry == "Retail":
-                impact *= 0.9      # Some sensitivity but less extreme
+    # events × industries impacts, only for event types we have sensitivities for
+    impact, scored = event_impacts(table)
+    scored_idx = np.flatnonzero(scored)
+    impact = impact[scored_idx]
+    risk_raws, opp_raws = split_risk_opp(impact)
+    top_rows = top_driver_rows(impact, k)
 
+    results = {}
 
-            drivers.append((impact, ev.get("title", "")))
+    has_opp = (impact > 0).any(axis=0)
+    has_risk = (impact <= 0).any(axis=0)
 
-            if impact > 0:
-                opp_raw += impact
-            else:
-                risk_raw += abs(impact)
+    for j, industry in enumerate(INDUSTRIES):
+        # accumulators stay a plain 0 until something is added to them
+        risk_raw = float(risk_raws[j]) if has_risk[j] else 0
+        opp_raw = float(opp_raws[j]) if has_opp[j] else 0
+        top = scored_idx[top_rows[:, j]]
+        drivers = [table.title[r] for r in top]
 
         # normalize
         risk = min(risk_raw, 0.8)
@@ -124,14 +96,13 @@ def score_industries():
             "Low"
         )
 
-        drivers = sorted(drivers, key=lambda x: abs(x[0]), reverse=True)[:3]
-
         results[industry] = {
             "risk_score": round(risk, 2),
             "opp_score": round(opp, 2),
             "risk_level": risk_level,
             "opp_level": opp_level,
-            "top_drivers": [d[1] for d in drivers]
+            "top_drivers": drivers,
+            "top_driver_events": driver_refs(table.ids, top, impact[top_rows[:, j], j]),
         }
 
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
@@ -141,4 +112,6 @@ def score_industries():
 
 
 if __name__ == "__main__":
-    score_industries()
+    parser = argparse.ArgumentParser(description="Regional industry scoring")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="drivers kept per industry")
+    score_industries(parser.parse_args().top_k)
@@ -1,9 +1,15 @@
 # src/industry/score_district.py
 
+import argparse
 import json
 from pathlib import Path
-from src.industry.sensitivity import SENSITIVITY_MATRIX, INDUSTRIES
+from src.events.table import EventTable
+from src.industry.sensitivity import INDUSTRIES
 from src.industry.footprint import INDUSTRY_REGIONS, district_to_province
+from src.industry.matrix import (
+    district_location_rows, driver_refs, event_severity, sensitivity_rows, split_risk_opp,
+    top_driver_rows,
+)
 
 EVENTS_PATH = Path("data/processed/events.json")
 OUTPUT_PATH = Path("data/processed/district_scores.json")
@@ -11,6 +17,8 @@ OUTPUT_PATH = Path("data/processed/district_scores.json")
 HIGH = 0.6
 MEDIUM = 0.3
 
+TOP_K = 3   # drivers kept per district × industry
+
 # Full Sri Lanka district list
 ALL_DISTRICTS = [
     "Colombo","Gampaha","Kalutara","Kandy","Matale","Nuwara Eliya","Galle","Matara",
@@ -38,52 +46,44 @@ def location_factor(industry, district):
 # -----------------------------------------
 # MAIN DISTRICT SCORING ENGINE
 # -----------------------------------------
-def score_districts():
+def score_districts(k: int = TOP_K):
 
     if not EVENTS_PATH.exists():
         print("events.json not found!")
         return
 
-    with open(EVENTS_PATH, "r", encoding="utf-8") as f:
-        events = json.load(f)
+    table = EventTable.load(EVENTS_PATH)
+
+    # One pass over the district columns: district -> events postings
+    offsets, postings = table.district_postings()
+
+    sens_rows, scored_rows = sensitivity_rows(table.types.names)
+    sev = event_severity(table)
+    loc_rows = district_location_rows(ALL_DISTRICTS)        # districts × industries
 
     district_scores = {}
 
     # For every district in SL
-    for dist in ALL_DISTRICTS:
+    for d, dist in enumerate(ALL_DISTRICTS):
         district_scores[dist] = {}
 
-        # Filter only events that occurred in this district
-        dist_events = [
-            ev for ev in events 
-            if dist in ev.get("districts", [])
-        ]
-
-        # For every industry
-        for industry in INDUSTRIES:
-            risk_raw = 0
-            opp_raw = 0
-            drivers = []
-
-            for ev in dist_events:
-                etype = ev.get("event_type")
-                sev = ev.get("severity", 0)
-
-                if etype not in SENSITIVITY_MATRIX:
-                    continue
-
-                sens = SENSITIVITY_MATRIX[etype][industry]
-                loc = location_factor(industry, dist)
+        # Events that occurred in this district and have a sensitivity row
+        code = table.districts.codes[dist]
+        evs = postings[offsets[code]:offsets[code + 1]]
+        evs = evs[scored_rows[table.type_code[evs]]]
 
-                # final impact score
-                impact = sev * sens * loc
+        # final impact score, events × industries
+        impact = sev[evs, None] * sens_rows[table.type_code[evs]] * loc_rows[d]
+        risk_raws, opp_raws = split_risk_opp(impact)
+        has_opp = (impact > 0).any(axis=0)
+        has_risk = (impact <= 0).any(axis=0)
+        top_rows = top_driver_rows(impact, k)
 
-                drivers.append((impact, ev.get("title", "")))
-
-                if impact > 0:
-                    opp_raw += impact
-                else:
-                    risk_raw += abs(impact)
+        # For every industry
+        for j, industry in enumerate(INDUSTRIES):
+            # accumulators stay a plain 0 until something is added to them
+            risk_raw = float(risk_raws[j]) if has_risk[j] else 0
+            opp_raw = float(opp_raws[j]) if has_opp[j] else 0
 
             # Normalize
             risk = min(risk_raw, 1.0)
@@ -101,15 +101,17 @@ def score_districts():
                 "Low"
             )
 
-            # Pick 3 strongest drivers
-            top = sorted(drivers, key=lambda x: abs(x[0]), reverse=True)[:3]
+            # k strongest drivers
+            top_evs = evs[top_rows[:, j]]
+            top = [table.title[r] for r in top_evs]
 
             district_scores[dist][industry] = {
                 "risk_score": round(risk, 2),
                 "opp_score": round(opp, 2),
                 "risk_level": risk_level,
                 "opp_level": opp_level,
-                "top_drivers": [t[1] for t in top]
+                "top_drivers": top,
+                "top_driver_events": driver_refs(table.ids, top_evs, impact[top_rows[:, j], j]),
             }
 
     # Save output
@@ -120,4 +122,6 @@ def score_districts():
 
 
 if __name__ == "__main__":
-    score_districts()
+    parser = argparse.ArgumentParser(description="District-level industry scoring")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="drivers kept per cell")
+    score_districts(parser.parse_args().top_k)
@@ -318,3 +318,15 @@ SENSITIVITY_MATRIX = {
     }
 }
 
+# Industry exposure correction (Fix #5); industries not listed keep 1.0
+INDUSTRY_EXPOSURE = {
+    "IT": 0.25,          # IT is minimally affected by weather/disasters
+    "Banking": 0.5,      # Banking moderately affected by economic/political events
+    "Energy": 0.7,       # Energy affected by storms, outages, but not extreme
+    "Tourism": 0.8,      # Tourism is sensitive, but not as severely as Apparel/Logistics
+    "Agriculture": 1.2,  # Agriculture is HIGHLY sensitive to weather conditions
+    "Water": 1.2,        # Water industry benefits strongly from weather events
+    "Logistics": 1.0,    # Logistics heavily affected by roads/weather
+    "Apparel": 1.0,      # Apparel very dependent on transport and weather
+    "Retail": 0.9,       # Some sensitivity but less extreme
+}
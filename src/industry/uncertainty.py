@@ -0,0 +1,217 @@
+# src/industry/uncertainty.py
+"""
+Bootstrap confidence bands for industry and district × industry scores.
+
+A score built from three events is far less certain than the same score
+built from three hundred. This module resamples the scored events with
+replacement and rescores each resample. Every score then gets a band
+between two percentiles of the replicate scores.
+
+A resample is a vector of per-event counts (multinomial, summing to the
+number of events), so one replicate is a weighted rescoring:
+
+    G[b, t, i] = Σ_{e of type t} count[b, e] · severity[e] · location[e, i]
+    H[b, t, d] = Σ_{e of type t in d} count[b, e] · severity[e]
+
+followed by the same sensitivity / location / exposure products and caps
+as the engine. With every count at 1 the replicate gives the engine's
+scores up to float rounding (per-type matrix products instead of event
+by event sums). The per-type blocks are built once in the parent.
+Replicates are generated in fixed chunks with their own seeds, so the
+bands do not depend on the number of workers.
+
+Severity carries a recency term, so bands describe the scores at one
+instant. BootstrapModel(table, now) rebuilds severity from
+severity_static at `now`; the pipeline records the instant it used, and
+the dashboard re-bootstraps at its own view time so the bands sit around
+the live scores it draws them on.
+
+    python -m src.industry.uncertainty --n 200 --level 0.9
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.events.severity import recency_weights, severity_at, static_severity_table
+from src.events.store import write_json_atomic
+from src.events.table import EventTable
+from src.utils.timeparse import now_epoch
+from .matrix import (
+    district_location_rows, district_membership, event_location_factors, event_severity,
+    exposure_vector, sensitivity_rows,
+)
+from .score_district import ALL_DISTRICTS
+from .sensitivity import INDUSTRIES, SENSITIVITY_MATRIX
+
+EVENTS_PATH = Path("data/processed/events.json")
+OUTPUT_PATH = Path("data/processed/score_intervals.json")
+
+SCORED_TYPES = list(SENSITIVITY_MATRIX)
+BOOTSTRAP_CHUNK = 25   # replicates per worker task
+
+
+# ------------------------------
+# Cached event features
+# ------------------------------
+class BootstrapModel:
+
+    def __init__(self, table: EventTable, now: Optional[int] = None):
+        type_row = np.array(
+            [SCORED_TYPES.index(n) if n in SENSITIVITY_MATRIX else -1 for n in table.types.names]
+            + [-1],
+            dtype=np.int64,
+        )[table.type_code]
+        scored = np.flatnonzero(type_row >= 0)
+
+        # severity column as stored, or rebuilt at `now` like live.ScorePartials
+        if now is None:
+            sev = event_severity(table)
+        else:
+            static = table.severity_static
+            if np.isnan(static).any():
+                static = static_severity_table(table)
+            sev = severity_at(static, recency_weights(table.ts, now))
+        sev = sev[scored][:, None]
+        national = sev * event_location_factors(table)[scored]                # E × I
+        district = sev * district_membership(table, ALL_DISTRICTS)[scored]    # E × D
+
+        # per type: cached rows, and their severity-weighted blocks
+        types = type_row[scored]
+        self.by_type: List[Tuple[int, np.ndarray, np.ndarray, np.ndarray]] = []
+        for t in np.unique(types):
+            rows = np.flatnonzero(types == t)
+            self.by_type.append((int(t), rows, national[rows], district[rows]))
+
+        sens = sensitivity_rows(SCORED_TYPES)[0][:-1]
+        self.sens_opp = np.where(sens > 0, sens, 0.0)
+        self.sens_risk = np.where(sens < 0, -sens, 0.0)
+
+        self.district_loc = district_location_rows(ALL_DISTRICTS)     # D × I
+        self.exposure = exposure_vector()
+        self.n_events = len(scored)
+        self.now = now
+
+    def score(self, counts: np.ndarray) -> Dict[str, np.ndarray]:
+        """Clamped scores for each row of per-event counts (replicates × events).
+
+        national_*: replicates × industries, district_*: replicates × districts × industries.
+        """
+        b = len(counts)
+        n_t, n_i, n_d = len(SCORED_TYPES), len(INDUSTRIES), len(ALL_DISTRICTS)
+
+        G = np.zeros((b, n_t, n_i))
+        H = np.zeros((b, n_t, n_d))
+        for t, rows, national, district in self.by_type:
+            G[:, t] = counts[:, rows] @ national
+            H[:, t] = counts[:, rows] @ district
+
+        risk = np.einsum("bti,ti->bi", G, self.sens_risk) / 2 * self.exposure
+        opp = np.einsum("bti,ti->bi", G, self.sens_opp) / 2 * self.exposure
+        return {
+            "national_risk": np.minimum(risk, 0.8),
+            "national_opp": np.minimum(opp, 0.85),
+            "district_risk": np.minimum(
+                np.einsum("btd,ti->bdi", H, self.sens_risk) * self.district_loc, 1.0),
+            "district_opp": np.minimum(
+                np.einsum("btd,ti->bdi", H, self.sens_opp) * self.district_loc, 1.0),
+        }
+
+    def replicates(self, n: int, seed) -> Dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        e = self.n_events
+        counts = rng.multinomial(e, np.full(e, 1.0 / e), size=n).astype(np.float64) if e \
+            else np.zeros((n, 0))
+        return self.score(counts)
+
+
+# ------------------------------
+# Process pool
+# ------------------------------
+_MODEL: Optional[BootstrapModel] = None
+
+
+def _bootstrap_chunk(task):
+    """Worker entry point: (n, seed, now). The model is built in the parent
+    before the pool forks, so workers share it copy-on-write."""
+    global _MODEL
+    n, seed, now = task
+    if _MODEL is None:
+        _MODEL = BootstrapModel(EventTable.load(EVENTS_PATH), now)
+    return _MODEL.replicates(n, seed)
+
+
+def bootstrap_scores(model: BootstrapModel, n: int = 200, seed: int = 0,
+                     workers: int = 1) -> Dict[str, np.ndarray]:
+    """n replicate scores, in BOOTSTRAP_CHUNK chunks spread over `workers` processes."""
+    global _MODEL
+    sizes = [min(BOOTSTRAP_CHUNK, n - start) for start in range(0, n, BOOTSTRAP_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(size, child, model.now) for size, child in zip(sizes, seeds)]
+
+    _MODEL = model
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            parts = list(pool.map(_bootstrap_chunk, tasks))
+    else:
+        parts = [_bootstrap_chunk(task) for task in tasks]
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+# ------------------------------
+# Bands
+# ------------------------------
+def score_bands(samples: Dict[str, np.ndarray], level: float = 0.9) -> Dict:
+    """Percentile bands per industry and per district × industry."""
+    tail = (1 - level) / 2 * 100
+    bands = {k: np.round(np.percentile(v, [tail, 100 - tail], axis=0), 2)
+             for k, v in samples.items()}
+
+    def cell(prefix, *index):
+        risk, opp = bands[f"{prefix}_risk"], bands[f"{prefix}_opp"]
+        return {
+            "risk_low": float(risk[(0,) + index]),
+            "risk_high": float(risk[(1,) + index]),
+            "opp_low": float(opp[(0,) + index]),
+            "opp_high": float(opp[(1,) + index]),
+        }
+
+    return {
+        "industries": {ind: cell("national", j) for j, ind in enumerate(INDUSTRIES)},
+        "districts": {
+            district: {ind: cell("district", d, j) for j, ind in enumerate(INDUSTRIES)}
+            for d, district in enumerate(ALL_DISTRICTS)
+        },
+    }
+
+
+def run_uncertainty(n: int = 200, level: float = 0.9, seed: int = 0, workers: int = 1):
+    if not EVENTS_PATH.exists():
+        print("events.json not found!")
+        return
+
+    now = now_epoch()
+    model = BootstrapModel(EventTable.load(EVENTS_PATH), now)
+    bands = score_bands(bootstrap_scores(model, n, seed, workers), level)
+    bands["bootstrap"] = {
+        "n": n, "level": level, "seed": seed, "events": model.n_events, "now": now,
+    }
+    write_json_atomic(OUTPUT_PATH, bands, indent=2)
+
+    print(f"{level:.0%} bands from {n} resamples of {model.n_events} events "
+          f"(workers={workers}) →", OUTPUT_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bootstrap confidence bands for scores")
+    parser.add_argument("--n", type=int, default=200, help="bootstrap resamples")
+    parser.add_argument("--level", type=float, default=0.9, help="confidence level of the band")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="process pool size for the resamples")
+    args = parser.parse_args()
+    run_uncertainty(args.n, args.level, args.seed, args.workers)
@@ -1,20 +1,30 @@
 # run_pipeline.py
 
+import argparse
+import os
 import subprocess
+from typing import Optional
+
+# national + province + district scores: full pass, or windowed accumulators
+SCORING = {
+    False: "python -m src.industry.engine",
+    True: "python -m src.industry.accumulators --publish{hours}",
+}
 
 COMMANDS = [
     "python -m src.scrapers.news_collector",
     "python -m src.scrapers.gov_collector",
     "python -m src.scrapers.weather_collector",
     "",
-    "python -m src.events.normalize",
-    "python -m src.events.trim_last_day",   # If you want last 24 hours only
-    "python -m src.events.classify_advanced",
+    "python -m src.events.normalize --workers {workers}",
+    "python -m src.events.trim_last_day{hours}",   # events window (default 48h)
+    "python -m src.events.classify_advanced --workers {workers}{hours}",   # trend window = same
     "python -m src.events.severity",
+    "python -m src.industry.live",   # read-time score cache (recency decay)
     "",
-    "python -m src.industry.score",
-    "python -m src.industry.score_district",
-    "python -m src.district.aggregate"
+    "{scoring}",
+    "python -m src.industry.uncertainty --workers {workers}",   # bootstrap score bands
+    "python -m src.industry.history --append",   # score snapshot for trends
 
 
 ]
@@ -26,17 +36,28 @@ def run(cmd):
     print(f"\n\n=== RUNNING: {cmd} ===")
     subprocess.call(cmd, shell=True)
 
-def main():
+def main(workers: int = 1, incremental: bool = False, hours: Optional[float] = None):
     print("\n====================================")
     print("     SRI LANKA REALTIME PIPELINE")
     print("====================================\n")
 
+    # one window for trimming, trend clusters and accumulators
+    hours_arg = f" --hours {hours:g}" if hours else ""
+    scoring = SCORING[incremental].format(hours=hours_arg)
     for cmd in COMMANDS:
-        run(cmd)
+        run(cmd.format(workers=workers, scoring=scoring, hours=hours_arg))
 
     print("\n====================================")
     print("     PIPELINE COMPLETE ✔")
     print("====================================\n")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the full collection → scoring pipeline")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="process pool size for normalization, classification and bootstrap bands")
+    parser.add_argument("--incremental", action="store_true",
+                        help="update windowed score accumulators instead of rescoring every event")
+    parser.add_argument("--hours", type=float, default=None,
+                        help="events window passed to trimming, trend clustering and accumulators")
+    args = parser.parse_args()
+    main(args.workers, args.incremental, args.hours)
@@ -1,6 +1,7 @@
 import requests
 import json
 import time
+from datetime import datetime, timezone
 from src.scrapers import weather_key
 
 from pathlib import Path   
@@ -105,7 +106,11 @@ def fetch_weather(lat, lon):
             "weather_main": data["weather"][0]["main"],
             "weather_description": data["weather"][0]["description"],
             "clouds": data["clouds"]["all"],
-            "visibility": data.get("visibility", None)
+            "visibility": data.get("visibility", None),
+            # observation time reported by OpenWeather (also the history dedupe key)
+            "timestamp": datetime.fromtimestamp(
+                data.get("dt") or time.time(), tz=timezone.utc
+            ).isoformat()
         }
 
         # Detect potential warnings
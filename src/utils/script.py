@@ -0,0 +1,56 @@
+# src/utils/script.py
+"""
+Script detection + text normalization for English / Sinhala / Tamil text.
+"""
+
+import re
+import unicodedata
+from typing import List
+
+LATIN = "latin"
+SINHALA = "sinhala"
+TAMIL = "tamil"
+
+SCRIPTS = (LATIN, SINHALA, TAMIL)
+
+# One regex per Unicode block; re.search runs in C, so detection is cheap
+_SCRIPT_RES = {
+    LATIN: re.compile(r"[A-Za-z0-9]"),
+    SINHALA: re.compile("[\u0D80-\u0DFF]"),
+    TAMIL: re.compile("[\u0B80-\u0BFF]"),
+}
+
+_BLOCKS = {
+    SINHALA: (0x0D80, 0x0DFF),
+    TAMIL: (0x0B80, 0x0BFF),
+}
+
+# zero-width space / non-joiner / joiner, BOM
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff"))
+
+
+def detect_scripts(text: str) -> List[str]:
+    """Scripts present in the text, in SCRIPTS order."""
+    if not text:
+        return []
+    return [s for s in SCRIPTS if _SCRIPT_RES[s].search(text)]
+
+
+def dominant_script(text: str) -> str:
+    """Script most characters of a keyword belong to (Latin if none)."""
+    counts = {s: 0 for s in SCRIPTS}
+    for ch in text:
+        cp = ord(ch)
+        for script, (lo, hi) in _BLOCKS.items():
+            if lo <= cp <= hi:
+                counts[script] += 1
+                break
+        else:
+            if ch.isascii() and ch.isalnum():
+                counts[LATIN] += 1
+    return max(SCRIPTS, key=lambda s: counts[s])
+
+
+def normalize_text(text: str) -> str:
+    """NFC, zero-width characters removed, lowercased."""
+    return unicodedata.normalize("NFC", text).translate(_ZERO_WIDTH).lower()
@@ -0,0 +1,102 @@
+# src/utils/timeparse.py
+"""
+Timestamp parsing for every format the collectors produce:
+
+- RFC 822 pubDate      'Tue, 09 Dec 2025 12:00:42 +0000' / '... GMT'
+- GDELT seendate       '20251020T021500Z'
+- ISO 8601 (YouTube, gov fetched_at, reddit, our own output)
+
+Timestamps are parsed ONCE at ingest into a UTC epoch integer (seconds).
+Later stages only ever compare integers.
+"""
+
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+
+# ------------------------------
+# Format-specific parsers
+# ------------------------------
+def _parse_rfc822(value: str) -> Optional[int]:
+    dt = parsedate_to_datetime(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _parse_gdelt(value: str) -> Optional[int]:
+    dt = datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _parse_iso(value: str) -> Optional[int]:
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _pick_parser(value: str):
+    """Cheap shape check so each string only goes through one parser."""
+    if value[:1].isalpha():
+        return _parse_rfc822
+    if len(value) == 16 and value[8] == "T" and value.endswith("Z") and value[:8].isdigit():
+        return _parse_gdelt
+    return _parse_iso
+
+
+# ------------------------------
+# Public API
+# ------------------------------
+@lru_cache(maxsize=65536)
+def parse_timestamp(value: str) -> Optional[int]:
+    """
+    Parse any known timestamp string into UTC epoch seconds.
+    Returns None if the string cannot be parsed.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    value = value.strip()
+    if not value:
+        return None
+
+    try:
+        return _pick_parser(value)(value)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def to_epoch(value) -> Optional[int]:
+    """Accepts an epoch number, a timestamp string or None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return parse_timestamp(value)
+
+
+def now_epoch() -> int:
+    return int(time.time())
+
+
+def epoch_to_iso(ts: int) -> str:
+    """Canonical ISO string, e.g. '2025-12-09T12:00:42Z'."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def first_timestamp(*candidates):
+    """
+    Returns (epoch, iso) for the first parsable candidate.
+    Falls back to the current time if none parse.
+    """
+    for value in candidates:
+        ts = to_epoch(value)
+        if ts is not None:
+            return ts, epoch_to_iso(ts)
+
+    ts = now_epoch()
+    return ts, epoch_to_iso(ts)
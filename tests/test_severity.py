@@ -0,0 +1,35 @@
+import numpy as np
+
+from src.events.severity import (
+    compute_severity, compute_severity_table, recency_weight, recency_weights,
+)
+from src.events.table import EventTable
+
+NOW = 1_765_000_000
+
+
+def _events():
+    base = {"source_type": "gov", "title": "Flood warning", "event_type": "flood",
+            "districts": ["Colombo"], "trend_strength": 3, "confidence": 0.7}
+    return [
+        {**base, "id": "EVT-UNDATED", "timestamp": None, "ts": None},
+        {**base, "id": "EVT-FRESH", "ts": NOW - 600},
+        {**base, "id": "EVT-OLD", "ts": NOW - 30 * 3600},
+    ]
+
+
+def test_unknown_ts_round_trips_as_none():
+    table = EventTable.from_dicts(_events())
+    assert table.ts[0] == 0
+    assert table.row_dict(0)["ts"] is None
+    assert table.row_dict(1)["ts"] == NOW - 600
+
+
+def test_scalar_and_vector_recency_agree_without_timestamp():
+    assert recency_weight(None, NOW) == recency_weight(0, NOW) == 1.0
+    assert recency_weights(np.array([0]), NOW)[0] == 1.0
+
+    table = EventTable.from_dicts(_events())
+    vector = compute_severity_table(table, NOW)
+    scalar = [compute_severity(ev, NOW) for ev in table.to_dicts()]
+    assert list(vector) == scalar
@@ -0,0 +1,28 @@
+import pytest
+
+from src.events import store
+
+NOW = 1_765_000_000
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STORE_DIR", tmp_path)
+    monkeypatch.setattr(store, "MANIFEST_PATH", tmp_path / "manifest.json")
+    return tmp_path
+
+
+def test_event_without_timestamp_survives_append_and_read_window(store_dir):
+    undated = {"id": "EVT-UNDATED", "title": "Weather update", "ts": None, "timestamp": None}
+    dated = {"id": "EVT-DATED", "title": "Fuel price", "ts": NOW - 3600}
+    old = {"id": "EVT-OLD", "title": "Old news", "ts": NOW - 200 * 86400}
+
+    store.append_events([undated, dated, old])
+    assert store.apply_retention(now=NOW) == 1
+
+    ids = [ev["id"] for ev in store.read_window(48, now=NOW)]
+    assert ids == ["EVT-UNDATED", "EVT-DATED"]
+
+    # still there after retention runs far in the future
+    store.apply_retention(now=NOW + 365 * 86400)
+    assert [ev["id"] for ev in store.read_window(48, now=NOW + 365 * 86400)] == ["EVT-UNDATED"]